@@ -1,9 +1,16 @@
+import asyncio
 import os
-import time
-import subprocess
 import sys
 from pathlib import Path
 
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    # Fall back to polling the tree when watchdog isn't installed
+    FileSystemEventHandler = object
+    Observer = None
+
 # Which files trigger reloads
 WATCH_EXTENSIONS = (".py", ".json", ".txt", ".yaml", ".yml")
 
@@ -19,78 +26,175 @@ def get_project_root(script_path: Path) -> Path:
     return script_path.parent
 
 
-def get_latest_mtime(root: Path) -> float:
+# Directories never scanned for changes
+SKIP_DIRS = frozenset({".git", ".venv", "__pycache__", "node_modules", ".pytest_cache", ".mypy_cache"})
+
+
+class _ChangeDetected(Exception):
+    """Raised from deep inside the scan to unwind as soon as a change is seen."""
+
+
+def _scan(path, threshold: float = float("inf")) -> float:
+    """
+    Return the newest mtime of watched files under path.
+    Raise _ChangeDetected on the first mtime above threshold (never, by default).
+    """
     latest = 0.0
-    for dirpath, dirnames, filenames in os.walk(root):
-        # Skip junk dirs
-        for skip in (".git", ".venv", "__pycache__"):
-            if skip in dirnames:
-                dirnames.remove(skip)
-
-        for name in filenames:
-            if name.endswith(WATCH_EXTENSIONS):
-                path = Path(dirpath) / name
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
                 try:
-                    mtime = path.stat().st_mtime
-                    if mtime > latest:
-                        latest = mtime
+                    # Don't follow symlinked dirs (avoids loops and scanning outside the tree)
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in SKIP_DIRS:
+                            continue
+                        mtime = _scan(entry.path, threshold)
+                    elif entry.name.endswith(WATCH_EXTENSIONS):
+                        mtime = entry.stat().st_mtime
+                    else:
+                        continue
                 except FileNotFoundError:
                     # File may be mid-write; ignore
-                    pass
+                    continue
+                if mtime > threshold:
+                    raise _ChangeDetected()
+                if mtime > latest:
+                    latest = mtime
+    except (FileNotFoundError, NotADirectoryError):
+        # Directory removed between listing and scanning
+        pass
     return latest
 
 
-def run_loop(script_path: Path, script_args):
+def get_latest_mtime(root: Path) -> float:
+    # Plain str paths all the way down: DirEntry.path is joined in C, no Path objects per file
+    return _scan(os.fspath(root))
+
+
+def has_changed_since(root: Path, last_mtime: float) -> bool:
+    """Check whether any watched file is newer than last_mtime, stopping at the first one."""
+    try:
+        _scan(os.fspath(root), last_mtime)
+    except _ChangeDetected:
+        return True
+    return False
+
+
+class _ChangeHandler(FileSystemEventHandler):
+    """Calls notify() whenever a watched file outside the junk dirs changes."""
+
+    def __init__(self, notify):
+        super().__init__()
+        self.notify = notify
+
+    def _is_watched(self, path) -> bool:
+        if not path:
+            return False
+        path = os.fsdecode(path)
+        if not path.endswith(WATCH_EXTENSIONS):
+            return False
+        return not any(part in SKIP_DIRS for part in Path(path).parts)
+
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type not in ("created", "modified", "moved"):
+            return
+        if self._is_watched(event.src_path) or self._is_watched(getattr(event, "dest_path", "")):
+            self.notify()
+
+
+class ChangeWatcher:
+    """
+    Waits for watched files to change.
+    Uses inotify via watchdog when available, otherwise polls the tree.
+    Must be created inside the running event loop.
+    """
+
+    POLL_INTERVAL = 0.5
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.loop = asyncio.get_running_loop()
+        self.changed = asyncio.Event()
+        self.observer = None
+        self.last_mtime = 0.0
+
+        if Observer is not None:
+            self.observer = Observer()
+            # watchdog calls back on its own thread; hand the event over to the loop
+            notify = lambda: self.loop.call_soon_threadsafe(self.changed.set)
+            self.observer.schedule(_ChangeHandler(notify), str(root), recursive=True)
+            self.observer.start()
+        else:
+            print("watchdog not installed; falling back to polling for changes")
+            self.last_mtime = get_latest_mtime(root)
+
+    async def wait(self):
+        """Return once a watched file has changed."""
+        if self.observer is not None:
+            await self.changed.wait()
+            self.changed.clear()
+            return
+
+        while True:
+            await asyncio.sleep(self.POLL_INTERVAL)
+            if has_changed_since(self.root, self.last_mtime):
+                self.last_mtime = get_latest_mtime(self.root)
+                return
+
+    def stop(self):
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+
+
+async def stop_process(proc):
+    """Terminate the script, killing it if it doesn't exit within 2 seconds."""
+    if proc.returncode is not None:
+        return
+    proc.terminate()
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=2)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+
+
+async def run_loop(script_path: Path, script_args):
     project_root = get_project_root(script_path)
 
     print(f"Dev runner watching: {project_root}")
     print(f"Running script: {script_path}")
     print(f"With args: {' '.join(script_args) if script_args else '<none>'}")
 
-    last_mtime = get_latest_mtime(project_root)
-
-    while True:
-        cmd = ["python3", str(script_path)] + script_args
-        print("\n=== Starting process ===")
-        print(" ".join(cmd))
-        proc = subprocess.Popen(cmd)
-
-        try:
-            while True:
-                time.sleep(0.5)
-
-                # If script exited, wait for a change then restart
-                if proc.poll() is not None:
-                    print(f"Process exited with code {proc.returncode}. Waiting for file change to restart…")
-                    while True:
-                        time.sleep(0.5)
-                        current_mtime = get_latest_mtime(project_root)
-                        if current_mtime > last_mtime:
-                            last_mtime = current_mtime
-                            print("🔁 Change detected after exit. Restarting…")
-                            break
-                    break
+    watcher = ChangeWatcher(project_root)
+    proc = None
+
+    try:
+        while True:
+            cmd = ["python3", str(script_path)] + script_args
+            print("\n=== Starting process ===")
+            print(" ".join(cmd))
+            proc = await asyncio.create_subprocess_exec(*cmd)
+
+            # Race "script exited" against "file changed" - no polling of either
+            exited = asyncio.create_task(proc.wait())
+            changed = asyncio.create_task(watcher.wait())
+            done, _ = await asyncio.wait({exited, changed}, return_when=asyncio.FIRST_COMPLETED)
 
+            if changed in done:
                 # Live reload: restart when any watched file changes
-                current_mtime = get_latest_mtime(project_root)
-                if current_mtime > last_mtime:
-                    last_mtime = current_mtime
-                    print("🔁 Change detected. Restarting process…")
-                    proc.terminate()
-                    try:
-                        proc.wait(timeout=2)
-                    except subprocess.TimeoutExpired:
-                        proc.kill()
-                    break
-
-        except KeyboardInterrupt:
-            print("\nStopping dev runner…")
-            proc.terminate()
-            try:
-                proc.wait(timeout=2)
-            except subprocess.TimeoutExpired:
-                proc.kill()
-            break
+                exited.cancel()
+                print("🔁 Change detected. Restarting process…")
+                await stop_process(proc)
+            else:
+                # Script exited, wait for a change then restart
+                print(f"Process exited with code {proc.returncode}. Waiting for file change to restart…")
+                await changed
+                print("🔁 Change detected after exit. Restarting…")
+    finally:
+        if proc is not None:
+            await stop_process(proc)
+        watcher.stop()
 
 
 if __name__ == "__main__":
@@ -104,4 +208,7 @@ if __name__ == "__main__":
         sys.exit(1)
 
     args = sys.argv[2:]
-    run_loop(script, args)
\ No newline at end of file
+    try:
+        asyncio.run(run_loop(script, args))
+    except KeyboardInterrupt:
+        print("\nStopping dev runner…")
\ No newline at end of file
@@ -7,18 +7,163 @@ Builds a local route database by querying the Aerodatabox API for flight routes.
 import json
 import time
 import re
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Any, Dict, Generator, List, Optional, Iterable, Iterator, TextIO, Tuple, Union
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    # Optional: stdlib json is used when orjson isn't installed
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    # Optional: streams large databases on load instead of parsing them in one go
+    ijson = None
+
+try:
+    import msgspec
+except ImportError:
+    # Optional: typed decoding of API responses; the dict walk is used without it
+    msgspec = None
+
+
+# One route record as stored in the database, e.g. {"origin": "DXB", "destination": "LHR", ...}
+RouteData = Dict[str, str]
+# (flight_number, route_data or None, whether a miss is definitive)
+LookupResult = Tuple[str, Optional[RouteData], bool]
+
+
+# ICAO airline prefix + flight number, e.g. "UAE215" -> ("UAE", "215")
+ICAO_FLIGHT_RE = re.compile(r'^([A-Z]{3})(\d+[A-Z]?)$')
+
+
+if msgspec is not None:
+    class _Airport(msgspec.Struct):
+        iata: Optional[str] = None
+        icao: Optional[str] = None
+        name: Optional[str] = None
+        municipalityName: Optional[str] = None
+        countryCode: Optional[str] = None
+
+    class _Endpoint(msgspec.Struct):
+        airport: Optional[_Airport] = None
+
+    class _Flight(msgspec.Struct):
+        departure: Optional[_Endpoint] = None
+        arrival: Optional[_Endpoint] = None
+
+    # Decodes the usual Aerodatabox shape straight from bytes, skipping unknown fields
+    _FLIGHT_DECODER = msgspec.json.Decoder(Union[List[_Flight], _Flight])
+else:
+    _FLIGHT_DECODER = None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    Tokens refill at `rate` per second up to `burst`; each request takes one.
+    """
+    
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+    
+    def acquire(self):
+        """Take a token, sleeping until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            # Reserve the token now (may go negative) so concurrent callers queue up fairly
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+    
+    def penalize(self, seconds: float):
+        """Drain the bucket so nobody sends for `seconds` (used on 429 Retry-After)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            # Idempotent: several workers hitting the same 429 still wait `seconds` once
+            self.tokens = min(self.tokens, -seconds * self.rate)
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    Token bucket whose state lives in shared memory, so worker processes
+    draw from one global rate limit.
+    """
+    
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = multiprocessing.Value('d', burst, lock=False)
+        self._last = multiprocessing.Value('d', time.monotonic(), lock=False)
+        self._lock = multiprocessing.Lock()
+    
+    @property
+    def tokens(self) -> float:
+        return self._tokens.value
+    
+    @tokens.setter
+    def tokens(self, value: float):
+        self._tokens.value = value
+    
+    @property
+    def last(self) -> float:
+        return self._last.value
+    
+    @last.setter
+    def last(self, value: float):
+        self._last.value = value
+
+
+def parse_retry_after(headers) -> Optional[float]:
+    """
+    Get the server-requested backoff in seconds from a 429 response.
+    Supports Retry-After (seconds or HTTP date) and RateLimit-Reset (seconds).
+    """
+    value = headers.get("Retry-After") or headers.get("RateLimit-Reset")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
 
 
 class FlightRouteBuilder:
     """Builds flight route database using Aerodatabox API."""
     
     API_URL = "https://aerodatabox.p.rapidapi.com/flights/number/{flight_number}/{date}"
-    DELAY_BETWEEN_REQUESTS = 0.5  # Seconds to wait between requests (be respectful of API limits)
+    RATE_LIMIT_PER_SECOND = 2.0  # Sustained request rate (be respectful of API limits)
+    RATE_LIMIT_BURST = 4  # Requests allowed back-to-back when the bucket is full
+    MAX_RETRY_AFTER = 120  # Longer 429 backoffs are treated as an exhausted quota
+    MAX_RATE_LIMIT_RETRIES = 3  # 429 retries per lookup before giving up on it for this run
+    NEGATIVE_TTL = 7 * 24 * 3600  # Don't re-query a "not found" flight for a week
+    MAX_CONCURRENT_REQUESTS = 4  # Lookups in flight at once; overlaps network wait, rate still capped
     
     # ICAO to IATA airline code conversion (for better API compatibility)
     ICAO_TO_IATA = {
@@ -26,6 +171,21 @@ class FlightRouteBuilder:
         "SVA": "SV", "AIC": "AI", "IGO": "6E", "KAC": "KU", "OMA": "WY",
     }
     
+    # Flight number ranges to scrape: (airline IATA code, first, stop, zero-pad width)
+    FLIGHT_RANGES = (
+        ("EK", 1, 1000, 3),      # Emirates - typically 3-digit
+        ("EK", 2000, 3000, 0),   # Emirates - some 4-digit
+        ("FZ", 100, 1000, 0),    # FlyDubai
+        ("QR", 800, 1000, 0),    # Qatar Airways
+        ("GF", 100, 1000, 0),    # Gulf Air
+        ("EY", 100, 1000, 0),    # Etihad
+        ("SV", 100, 1000, 0),    # Saudia
+        ("AI", 100, 999, 0),     # Air India
+        ("6E", 100, 999, 0),     # IndiGo
+        ("KU", 100, 999, 0),     # Kuwait Airways
+        ("WY", 100, 999, 0),     # Oman Air
+    )
+    
     def __init__(self, database_path: Path, rapidapi_key: str):
         """
         Initialize the route builder.
@@ -35,9 +195,45 @@ class FlightRouteBuilder:
             rapidapi_key: RapidAPI key for Aerodatabox API.
         """
         self.database_path = database_path
-        self.rapidapi_key = rapidapi_key
-        self.database: Dict[str, Dict] = {}
+        # Append-only log of routes found since the last full save
+        self.journal_path = database_path.with_suffix(".jsonl")
+        self._journal: Optional[TextIO] = None
+        # Single writer thread: journal appends and snapshots run in submission order
+        # while HTTP lookups carry on
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._pending_save = None
+        self.database: Dict[str, RouteData] = {}
         self.load_database()
+        # Flight numbers the API definitively had no route for -> unix time of the miss
+        self.negatives_path = database_path.with_suffix(".neg.json")
+        self.negatives: Dict[str, float] = {}
+        self.load_negatives()
+        self._init_http(rapidapi_key, TokenBucket(self.RATE_LIMIT_PER_SECOND, self.RATE_LIMIT_BURST))
+    
+    @classmethod
+    def for_worker(cls, rapidapi_key: str, bucket: TokenBucket) -> "FlightRouteBuilder":
+        """
+        Create a lookup-only builder for a worker process.
+        
+        It has no database or journal of its own; results go back to the
+        parent process, which owns all the files.
+        
+        Args:
+            rapidapi_key: RapidAPI key for Aerodatabox API.
+            bucket: Rate limiter shared with the other workers.
+        """
+        self = cls.__new__(cls)
+        self.negatives = {}
+        self._init_http(rapidapi_key, bucket)
+        return self
+    
+    def _init_http(self, rapidapi_key: str, bucket: TokenBucket):
+        """Set up the rate limiter and HTTP session used for lookups."""
+        self.rapidapi_key = rapidapi_key
+        # Per-thread flag: did the current lookup fail for a transient reason?
+        self._lookup_state = threading.local()
+        self.bucket = bucket
+        self.quota_exceeded = False
         
         self.headers = {
             "x-rapidapi-key": self.rapidapi_key,
@@ -45,12 +241,35 @@ class FlightRouteBuilder:
             "User-Agent": "FlightRouteBuilder/1.0"
         }
         
+        # Persistent session: keep-alive connections are reused across lookups,
+        # so only the first request per connection pays the TCP+TLS handshake
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=self.MAX_CONCURRENT_REQUESTS,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount("https://", adapter)
+        
     def load_database(self):
-        """Load existing route database from JSON file."""
+        """Load existing route database from JSON file, then replay the append log."""
         if self.database_path.exists():
             try:
-                with open(self.database_path, 'r', encoding='utf-8') as f:
-                    self.database = json.load(f)
+                if ijson is not None:
+                    # Stream one route at a time: peak memory stays at one record
+                    # instead of the whole parsed file
+                    self.database = {}
+                    with open(self.database_path, 'rb') as f:
+                        for key, route in ijson.kvitems(f, "", use_float=True):
+                            self.database[key.upper()] = route
+                else:
+                    if orjson is not None:
+                        raw = orjson.loads(self.database_path.read_bytes())
+                    else:
+                        with open(self.database_path, 'r', encoding='utf-8') as f:
+                            raw = json.load(f)
+                    self.database = {key.upper(): route for key, route in raw.items()}
                 print(f"Loaded {len(self.database)} existing routes from database")
             except Exception as e:
                 print(f"Warning: Could not load database: {e}")
@@ -58,20 +277,106 @@ class FlightRouteBuilder:
         else:
             self.database = {}
             print("Starting with empty database")
+        
+        if self.journal_path.exists():
+            replayed = 0
+            try:
+                with open(self.journal_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            # Torn last line from an interrupted run
+                            continue
+                        self.database[entry["k"].upper()] = entry["v"]
+                        replayed += 1
+                print(f"Replayed {replayed} routes from {self.journal_path.name}")
+            except Exception as e:
+                print(f"Warning: Could not read route journal: {e}")
     
-    def save_database(self):
-        """Save route database to JSON file."""
+    def load_negatives(self):
+        """Load the negative-result cache, dropping entries older than NEGATIVE_TTL."""
+        if not self.negatives_path.exists():
+            return
+        try:
+            with open(self.negatives_path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+            cutoff = time.time() - self.NEGATIVE_TTL
+            self.negatives = {key: seen for key, seen in raw.items() if seen > cutoff}
+            print(f"Loaded {len(self.negatives)} known not-found flights")
+        except Exception as e:
+            print(f"Warning: Could not load negative cache: {e}")
+            self.negatives = {}
+    
+    def is_known_negative(self, flight_number: str) -> bool:
+        """Check whether the flight was recently confirmed as not found."""
+        return self.negatives.get(flight_number, 0) + self.NEGATIVE_TTL > time.time()
+    
+    def _append_route(self, flight_number: str, route_data: Dict):
+        """Queue a single route for the journal (O(1) checkpoint instead of a full rewrite)."""
+        self._io_pool.submit(self._write_journal_line, flight_number, route_data)
+    
+    def _write_journal_line(self, flight_number: str, route_data: Dict):
+        """Append one route to the journal. Runs on the I/O thread."""
+        try:
+            if self._journal is None:
+                self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+                self._journal = open(self.journal_path, 'a', encoding='utf-8', buffering=1)
+            self._journal.write(json.dumps({"k": flight_number, "v": route_data}, ensure_ascii=False) + "\n")
+        except Exception as e:
+            print(f"Error appending to route journal: {e}")
+    
+    def _write_snapshot(self, snapshot: Dict[str, Dict], negatives: Dict[str, float]):
+        """
+        Write a database snapshot to the JSON file and compact the journal into it.
+        Runs on the I/O thread, after every journal line queued before the snapshot was taken.
+        """
         try:
             # Create parent directory if it doesn't exist
             self.database_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.database_path, 'w', encoding='utf-8') as f:
-                json.dump(self.database, f, indent=2, ensure_ascii=False)
-            print(f"Saved {len(self.database)} routes to {self.database_path}")
+            tmp_path = self.database_path.with_suffix(".json.tmp")
+            if orjson is not None:
+                tmp_path.write_bytes(orjson.dumps(snapshot, option=orjson.OPT_INDENT_2))
+            else:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, indent=2, ensure_ascii=False)
+            tmp_path.replace(self.database_path)
+            print(f"Saved {len(snapshot)} routes to {self.database_path}")
         except Exception as e:
             print(f"Error saving database: {e}")
+            return
+        
+        try:
+            with open(self.negatives_path, 'w', encoding='utf-8') as f:
+                json.dump(negatives, f)
+        except Exception as e:
+            print(f"Error saving negative cache: {e}")
+        
+        # Everything in the journal is now in the JSON file
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        try:
+            self.journal_path.unlink()
+        except FileNotFoundError:
+            pass
     
-    def lookup_flight_route(self, flight_number: str, date: str = None) -> Optional[Dict]:
+    def save_database_async(self):
+        """Snapshot the database in the background; lookups keep running while it writes."""
+        if self._pending_save is not None:
+            # Don't let snapshots pile up behind a slow disk
+            self._pending_save.result()
+        self._pending_save = self._io_pool.submit(
+            self._write_snapshot, dict(self.database), dict(self.negatives)
+        )
+    
+    def save_database(self):
+        """Save route database to JSON file and compact the journal into it, waiting for the write."""
+        self._io_pool.submit(self._write_snapshot, dict(self.database), dict(self.negatives)).result()
+        self._pending_save = None
+    
+    def lookup_flight_route(self, flight_number: str, date: Optional[str] = None) -> Optional[RouteData]:
         """
         Look up route data for a single flight number using Aerodatabox API.
         
@@ -88,20 +393,21 @@ class FlightRouteBuilder:
         # Clean flight number
         flight_number = flight_number.strip().upper()
         
+        if self.is_known_negative(flight_number):
+            return None
+        
         # Try original flight number first
         route_data = self._try_api_lookup(flight_number, date)
         if route_data:
             return route_data
         
-        # Try IATA conversion if it's a 3-letter ICAO code
-        match = re.match(r'^([A-Z]{3})(\d+[A-Z]?)$', flight_number)
-        if match:
-            airline_code = match.group(1)
-            flight_num = match.group(2)
-            
-            if airline_code in self.ICAO_TO_IATA:
-                iata_code = self.ICAO_TO_IATA[airline_code]
-                iata_flight = f"{iata_code}{flight_num}"
+        # Try IATA conversion if it's a known 3-letter ICAO code
+        # (dict check first: generated IATA numbers like "EK215" never need the regex)
+        iata_code = self.ICAO_TO_IATA.get(flight_number[:3])
+        if iata_code:
+            match = ICAO_FLIGHT_RE.match(flight_number)
+            if match:
+                iata_flight = f"{iata_code}{match.group(2)}"
                 route_data = self._try_api_lookup(iata_flight, date)
                 if route_data:
                     return route_data
@@ -115,197 +421,287 @@ class FlightRouteBuilder:
         
         return None
     
-    def _try_api_lookup(self, flight_number: str, date: str) -> Optional[Dict]:
+    def _try_api_lookup(self, flight_number: str, date: str) -> Optional[RouteData]:
         """Try to lookup a flight route via API."""
         url = self.API_URL.format(flight_number=flight_number, date=date)
         
+        if self.quota_exceeded:
+            self._lookup_state.transient = True
+            return None
+        
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+                self.bucket.acquire()
+                response = self.session.get(url, timeout=10)
+                if response.status_code != 429:
+                    break
+                if attempt == self.MAX_RATE_LIMIT_RETRIES:
+                    # Still rate limited: leave it for a later run
+                    self._lookup_state.transient = True
+                    return None
+                
+                # Rate limited: honour the server's backoff, or stop if it's a quota reset
+                retry_after = parse_retry_after(response.headers)
+                if retry_after is None or retry_after > self.MAX_RETRY_AFTER:
+                    if not self.quota_exceeded:
+                        print(f"  ⚠ API quota exceeded. Please wait before continuing.")
+                    self.quota_exceeded = True
+                    self._lookup_state.transient = True
+                    return None
+                print(f"  ⚠ Rate limited, backing off {retry_after:.1f}s")
+                self.bucket.penalize(retry_after)
             
             if response.status_code == 204:
                 # No content - flight not found
                 return None
             
-            if response.status_code == 429:
-                print(f"  ⚠ API quota exceeded. Please wait before continuing.")
-                return None
-            
             if response.status_code != 200:
+                # 404 is a definite miss; anything else (5xx, auth...) may work next time
+                if response.status_code != 404:
+                    self._lookup_state.transient = True
                 return None
             
-            data = response.json()
-            
-            # Parse the response
-            route_data = {
-                "origin": "",
-                "destination": "",
-                "origin_city": "",
-                "destination_city": "",
-                "origin_country": "",
-                "destination_country": "",
-            }
-            
-            # Handle different response structures
-            if isinstance(data, list) and len(data) > 0:
-                flight_data = data[0]
-            elif isinstance(data, dict):
-                flight_data = data
-            else:
-                return None
-            
-            # Extract departure/arrival airports
-            departure = (flight_data.get("departure") or 
-                        flight_data.get("dep") or 
-                        flight_data.get("origin") or {})
-            arrival = (flight_data.get("arrival") or 
-                      flight_data.get("arr") or 
-                      flight_data.get("destination") or {})
+            if _FLIGHT_DECODER is not None:
+                try:
+                    route_data = self._parse_typed_response(_FLIGHT_DECODER.decode(response.content))
+                except msgspec.ValidationError:
+                    # Not the usual shape (e.g. "dep"/"arr" keys); walk it generically
+                    route_data = None
+                if route_data is not None:
+                    return route_data or None
             
-            # Get airport codes and location info
-            if isinstance(departure, dict):
-                airport = departure.get("airport")
-                if isinstance(airport, dict):
-                    route_data["origin"] = airport.get("iata") or airport.get("icao") or ""
-                    route_data["origin_city"] = airport.get("municipalityName") or airport.get("name") or ""
-                    route_data["origin_country"] = airport.get("countryCode") or ""
-                else:
-                    route_data["origin"] = (departure.get("iata") or 
-                                           departure.get("icao") or "")
-            elif isinstance(departure, str):
-                route_data["origin"] = departure
-            
-            if isinstance(arrival, dict):
-                airport = arrival.get("airport")
-                if isinstance(airport, dict):
-                    route_data["destination"] = airport.get("iata") or airport.get("icao") or ""
-                    route_data["destination_city"] = airport.get("municipalityName") or airport.get("name") or ""
-                    route_data["destination_country"] = airport.get("countryCode") or ""
-                else:
-                    route_data["destination"] = (arrival.get("iata") or 
-                                                arrival.get("icao") or "")
-            elif isinstance(arrival, str):
-                route_data["destination"] = arrival
-            
-            # Only return if we found at least origin and destination
-            if route_data["origin"] and route_data["destination"]:
-                # Clean up strings
-                for key in route_data:
-                    if isinstance(route_data[key], str):
-                        route_data[key] = route_data[key].strip()
-                return route_data
-            else:
-                return None
+            data = orjson.loads(response.content) if orjson is not None else response.json()
+            return self._parse_response(data)
                 
         except requests.exceptions.RequestException as e:
+            self._lookup_state.transient = True
             return None
         except Exception as e:
+            self._lookup_state.transient = True
             return None
     
-    def generate_flight_list(self) -> List[str]:
+    def _parse_typed_response(self, flights: Any) -> Optional[RouteData]:
         """
-        Generate a list of common flight numbers to query.
-        Focuses on UAE/Gulf region airlines.
-        """
-        flights = []
-        
-        # Emirates (EK) - common routes (focus on likely active flights)
-        # EK flights are typically 3-digit, but some are 4-digit
-        for num in range(1, 1000):
-            flights.append(f"EK{num:03d}")
-        for num in range(2000, 3000):  # Some 4-digit EK flights
-            flights.append(f"EK{num}")
+        Build route data from a msgspec-decoded response.
         
-        # FlyDubai (FZ)
-        for num in range(100, 1000):
-            flights.append(f"FZ{num}")
-        
-        # Qatar Airways (QR)
-        for num in range(800, 1000):
-            flights.append(f"QR{num}")
+        Returns:
+            Route dict, {} if there is definitely no route, or None if the
+            response has to be walked generically by _parse_response.
+        """
+        if isinstance(flights, list):
+            if not flights:
+                return {}
+            flights = flights[0]
+        departure = flights.departure.airport if flights.departure else None
+        arrival = flights.arrival.airport if flights.arrival else None
+        if departure is None or arrival is None:
+            return None
         
-        # Gulf Air (GF)
-        for num in range(100, 1000):
-            flights.append(f"GF{num}")
+        route_data = {
+            "origin": (departure.iata or departure.icao or "").strip(),
+            "destination": (arrival.iata or arrival.icao or "").strip(),
+            "origin_city": (departure.municipalityName or departure.name or "").strip(),
+            "destination_city": (arrival.municipalityName or arrival.name or "").strip(),
+            "origin_country": (departure.countryCode or "").strip(),
+            "destination_country": (arrival.countryCode or "").strip(),
+        }
+        # Only return if we found at least origin and destination
+        if route_data["origin"] and route_data["destination"]:
+            return route_data
+        return {}
+    
+    def _parse_response(self, data: Any) -> Optional[RouteData]:
+        """Build route data from a decoded JSON response of any known shape."""
+        # Parse the response
+        route_data = {
+            "origin": "",
+            "destination": "",
+            "origin_city": "",
+            "destination_city": "",
+            "origin_country": "",
+            "destination_country": "",
+        }
         
-        # Etihad (EY)
-        for num in range(100, 1000):
-            flights.append(f"EY{num}")
+        # Handle different response structures
+        if isinstance(data, list) and len(data) > 0:
+            flight_data = data[0]
+        elif isinstance(data, dict):
+            flight_data = data
+        else:
+            return None
         
-        # Saudia (SV)
-        for num in range(100, 1000):
-            flights.append(f"SV{num}")
+        # Extract departure/arrival airports
+        departure = (flight_data.get("departure") or 
+                    flight_data.get("dep") or 
+                    flight_data.get("origin") or {})
+        arrival = (flight_data.get("arrival") or 
+                  flight_data.get("arr") or 
+                  flight_data.get("destination") or {})
         
-        # Air India (AI)
-        for num in range(100, 999):
-            flights.append(f"AI{num}")
+        # Get airport codes and location info
+        if isinstance(departure, dict):
+            airport = departure.get("airport")
+            if isinstance(airport, dict):
+                route_data["origin"] = airport.get("iata") or airport.get("icao") or ""
+                route_data["origin_city"] = airport.get("municipalityName") or airport.get("name") or ""
+                route_data["origin_country"] = airport.get("countryCode") or ""
+            else:
+                route_data["origin"] = (departure.get("iata") or 
+                                       departure.get("icao") or "")
+        elif isinstance(departure, str):
+            route_data["origin"] = departure
         
-        # IndiGo (6E)
-        for num in range(100, 999):
-            flights.append(f"6E{num}")
+        if isinstance(arrival, dict):
+            airport = arrival.get("airport")
+            if isinstance(airport, dict):
+                route_data["destination"] = airport.get("iata") or airport.get("icao") or ""
+                route_data["destination_city"] = airport.get("municipalityName") or airport.get("name") or ""
+                route_data["destination_country"] = airport.get("countryCode") or ""
+            else:
+                route_data["destination"] = (arrival.get("iata") or 
+                                            arrival.get("icao") or "")
+        elif isinstance(arrival, str):
+            route_data["destination"] = arrival
         
-        # Kuwait Airways (KU)
-        for num in range(100, 999):
-            flights.append(f"KU{num}")
+        # Only return if we found at least origin and destination
+        if route_data["origin"] and route_data["destination"]:
+            # Clean up strings
+            for key in route_data:
+                if isinstance(route_data[key], str):
+                    route_data[key] = route_data[key].strip()
+            return route_data
+        else:
+            return None
+    
+    def _lookup_task(self, flight_number: str) -> Tuple[Optional[RouteData], bool]:
+        """
+        Worker-thread wrapper around lookup_flight_route.
         
-        # Oman Air (WY)
-        for num in range(100, 999):
-            flights.append(f"WY{num}")
+        Returns:
+            Tuple of (route_data or None, whether a miss is definitive).
+        """
+        self._lookup_state.transient = False
+        route_data = self.lookup_flight_route(flight_number)
+        return route_data, not self._lookup_state.transient
+    
+    def generate_flight_list(self) -> Iterator[str]:
+        """
+        Generate common flight numbers to query (uppercase, lazily).
+        Focuses on UAE/Gulf region airlines.
+        """
+        for code, low, high, pad in self.FLIGHT_RANGES:
+            for num in range(low, high):
+                yield f"{code}{num:0{pad}d}"
+    
+    def count_flight_list(self) -> int:
+        """Number of flights generate_flight_list() yields, without generating them."""
+        return sum(high - low for _, low, high, _ in self.FLIGHT_RANGES)
+    
+    def _threaded_results(self, pending: List[str]) -> Generator[LookupResult, None, None]:
+        """Run lookups on worker threads, yielding (flight_number, route_data, definitive)."""
+        executor = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS)
+        try:
+            futures = {executor.submit(self._lookup_task, fn): fn for fn in pending}
+            for future in as_completed(futures):
+                try:
+                    route_data, definitive = future.result()
+                except Exception:
+                    route_data, definitive = None, False
+                yield futures[future], route_data, definitive
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _process_results(self, pending: List[str], processes: int) -> Generator[LookupResult, None, None]:
+        """
+        Run lookups in worker processes, yielding (flight_number, route_data, definitive).
         
-        return flights
+        Each process has its own session; all of them share one rate limit.
+        """
+        bucket = SharedTokenBucket(self.RATE_LIMIT_PER_SECOND, self.RATE_LIMIT_BURST)
+        with multiprocessing.Pool(processes=processes, initializer=_init_worker,
+                                  initargs=(self.rapidapi_key, bucket)) as pool:
+            for flight_number, route_data, definitive, quota_exceeded in pool.imap_unordered(
+                    _lookup_in_worker, pending, chunksize=8):
+                if quota_exceeded and not self.quota_exceeded:
+                    print(f"  ⚠ API quota exceeded. Please wait before continuing.")
+                    self.quota_exceeded = True
+                yield flight_number, route_data, definitive
     
-    def build_database(self, flight_numbers: List[str], save_interval: int = 50):
+    def build_database(self, flight_numbers: Iterable[str], save_interval: int = 50,
+                       processes: int = 1):
         """
         Build route database for a list of flight numbers.
         
+        Each route is appended to the journal as soon as it is found, and the
+        JSON file is rewritten in the background every save_interval flights.
+        
         Args:
-            flight_numbers: List of flight numbers to query
-            save_interval: Save database every N flights (to avoid data loss)
+            flight_numbers: Uppercase flight numbers to query
+            save_interval: Snapshot the database every N flights
+            processes: Worker processes to spread lookups and response parsing
+                over; 1 keeps everything in this process on threads
         """
-        total = len(flight_numbers)
+        # Skip anything already in the database up front (keys are uppercase)
+        # (counted while streaming, so only the pending numbers are kept in memory)
+        database = self.database
+        total = 0
+        known_negative = 0
+        pending = []
+        for fn in flight_numbers:
+            total += 1
+            if fn in database:
+                continue
+            if self.is_known_negative(fn):
+                known_negative += 1
+                continue
+            pending.append(fn)
+        skipped = total - len(pending) - known_negative
         found = 0
-        skipped = 0
         errors = 0
-        quota_hit = False
+        completed = 0
         
         print(f"Starting to query {total} flights...")
         print(f"Saving database every {save_interval} flights")
         print("-" * 60)
         
-        for i, flight_number in enumerate(flight_numbers, 1):
-            # Skip if already in database
-            if flight_number.upper() in self.database:
-                skipped += 1
-                if i % 100 == 0:
-                    print(f"Progress: {i}/{total} (found: {found}, skipped: {skipped}, errors: {errors})")
-                continue
-            
-            print(f"[{i}/{total}] Querying {flight_number}...", end=" ")
-            
-            route_data = self.lookup_flight_route(flight_number)
-            
-            if route_data:
-                self.database[flight_number.upper()] = route_data
-                found += 1
-                print(f"✓ Found: {route_data['origin']} → {route_data['destination']}")
-            else:
-                errors += 1
-                print("✗ Not found")
-            
-            # Check for quota exceeded
-            if route_data is None and "quota" in str(route_data).lower():
-                quota_hit = True
-                print("\n⚠ API quota exceeded. Stopping to avoid further issues.")
-                print("  You can resume later - already scraped routes are saved.")
-                break
-            
-            # Save periodically
-            if i % save_interval == 0:
-                self.save_database()
-                print(f"  (Saved database: {len(self.database)} routes)")
-            
-            # Rate limiting
-            if i < total and not quota_hit:
-                time.sleep(self.DELAY_BETWEEN_REQUESTS)
+        if skipped:
+            print(f"Skipping {skipped} flights already in database")
+        if known_negative:
+            print(f"Skipping {known_negative} flights recently confirmed as not found")
+        
+        # Lookups run on worker threads (or processes); this thread is the only one
+        # touching self.database, so results are merged and saved without locking
+        if processes > 1:
+            results = self._process_results(pending, processes)
+        else:
+            results = self._threaded_results(pending)
+        try:
+            for flight_number, route_data, definitive in results:
+                completed += 1
+                
+                if route_data:
+                    self.database[flight_number] = route_data
+                    self._append_route(flight_number, route_data)
+                    found += 1
+                    print(f"[{completed}/{len(pending)}] {flight_number}: ✓ Found: {route_data['origin']} → {route_data['destination']}")
+                else:
+                    errors += 1
+                    if definitive:
+                        self.negatives[flight_number] = time.time()
+                    print(f"[{completed}/{len(pending)}] {flight_number}: ✗ Not found")
+                
+                # Stop on quota exceeded
+                if self.quota_exceeded:
+                    print("\n⚠ API quota exceeded. Stopping to avoid further issues.")
+                    print("  You can resume later - already scraped routes are saved.")
+                    break
+                
+                # Snapshot periodically without blocking the lookups
+                if completed % save_interval == 0:
+                    self.save_database_async()
+        finally:
+            # Shuts the worker pool down, also when we stop early
+            results.close()
         
         # Final save
         self.save_database()
@@ -315,17 +711,40 @@ class FlightRouteBuilder:
         print(f"  Total flights: {total}")
         print(f"  Found routes: {found}")
         print(f"  Already in DB: {skipped}")
+        print(f"  Known not found (skipped): {known_negative}")
         print(f"  Not found/errors: {errors}")
         print(f"  Total in database: {len(self.database)}")
         
-        if quota_hit:
+        if self.quota_exceeded:
             print("\n⚠ API quota was exceeded. Resume later to continue.")
 
 
+# Lookup-only builder owned by each worker process (see _process_results)
+_worker_builder: Optional[FlightRouteBuilder] = None
+
+
+def _init_worker(rapidapi_key: str, bucket: SharedTokenBucket):
+    """Pool initializer: give this worker process its own session."""
+    global _worker_builder
+    _worker_builder = FlightRouteBuilder.for_worker(rapidapi_key, bucket)
+
+
+def _lookup_in_worker(flight_number: str) -> Tuple[str, Optional[RouteData], bool, bool]:
+    """Look up one flight in a worker process; returns (flight_number, route_data, definitive, quota_exceeded)."""
+    route_data, definitive = _worker_builder._lookup_task(flight_number)
+    return flight_number, route_data, definitive, _worker_builder.quota_exceeded
+
+
 def main():
     """Main entry point."""
+    import argparse
     import sys
     
+    parser = argparse.ArgumentParser(description="Build the flight route database")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="Worker processes for lookups (default: 1, threads only)")
+    args = parser.parse_args()
+    
     # Get project root
     project_root = Path(__file__).parent.parent
     database_path = project_root / "data" / "flight_routes.json"
@@ -349,11 +768,12 @@ def main():
     # Generate flight list
     print("Generating flight list...")
     flight_numbers = builder.generate_flight_list()
-    print(f"Generated {len(flight_numbers)} flight numbers to query")
+    flight_count = builder.count_flight_list()
+    print(f"Generated {flight_count} flight numbers to query")
     
     # Ask user if they want to proceed
-    print(f"\nThis will query {len(flight_numbers)} flights using Aerodatabox API.")
-    print(f"Estimated time: ~{len(flight_numbers) * builder.DELAY_BETWEEN_REQUESTS / 60:.1f} minutes")
+    print(f"\nThis will query {flight_count} flights using Aerodatabox API.")
+    print(f"Estimated time: ~{flight_count / builder.RATE_LIMIT_PER_SECOND / 60:.1f} minutes")
     print(f"Note: This uses your API quota. Only flights with active routes will be found.")
     response = input("Continue? (y/n): ")
     
@@ -362,7 +782,7 @@ def main():
         return
     
     # Start building database
-    builder.build_database(flight_numbers, save_interval=50)
+    builder.build_database(flight_numbers, save_interval=50, processes=args.processes)
 
 
 if __name__ == "__main__":
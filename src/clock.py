@@ -4,6 +4,7 @@ Displays current time and optionally date.
 Uses CSS-like styling system with class-based targeting.
 """
 
+import math
 import time
 from datetime import datetime
 
@@ -39,80 +40,112 @@ class Clock:
         self.format_24h = clock_config.get("format_24h", False)
         self.show_seconds = clock_config.get("show_seconds", True)
         self.show_date = clock_config.get("show_date", True)
-    
-    def get_time_string(self) -> str:
-        """Get formatted time string based on config."""
-        now = datetime.now()
         
+        # Formats are fixed for the lifetime of the clock
         if self.format_24h:
-            if self.show_seconds:
-                return now.strftime("%H:%M:%S")
-            else:
-                return now.strftime("%H:%M")
+            self.time_format = "%H:%M:%S" if self.show_seconds else "%H:%M"
         else:
-            if self.show_seconds:
-                return now.strftime("%I:%M:%S %p")
-            else:
-                return now.strftime("%I:%M %p")
+            self.time_format = "%I:%M:%S %p" if self.show_seconds else "%I:%M %p"
+        self.date_format = "%b %d, %Y"
+        
+        # Without a date line the time is centered vertically
+        self._time_overrides = None if self.show_date else {"gravity": "center"}
+        
+        # Every string a format produces has the same length and the BDF fonts are
+        # fixed-width, so element positions are worked out once here, not per frame
+        sample = datetime(2000, 1, 1)
+        self._time_pos = self.layout.position_for(Element(
+            text=sample.strftime(self.time_format),
+            classes=["time-display"],
+            style_overrides=self._time_overrides
+        ))
+        self._date_pos = None
+        if self.show_date:
+            self._date_pos = self.layout.position_for(Element(
+                text=sample.strftime(self.date_format),
+                classes=["date-display"]
+            ))
+        
+        # Last rendered (time, date) strings, so unchanged frames skip the redraw
+        self._last_rendered = (None, None)
+        self._last_second = None
+    
+    def get_time_string(self) -> str:
+        """Get formatted time string based on config."""
+        return datetime.now().strftime(self.time_format)
     
     def get_date_string(self) -> str:
         """Get formatted date string."""
-        now = datetime.now()
-        return now.strftime("%b %d, %Y")
+        return datetime.now().strftime(self.date_format)
     
     def display(self):
         """Display the current time (and date if enabled) using CSS-like styling."""
+        # Nothing shown can change within the same wall-clock second
+        now_second = int(time.time())
+        if now_second == self._last_second:
+            return
+        self._last_second = now_second
+        
         time_str = self.get_time_string()
+        date_str = self.get_date_string() if self.show_date else None
+        
+        # Skip clearing, drawing and swapping when the text is unchanged
+        if (time_str, date_str) == self._last_rendered:
+            return
+        self._last_rendered = (time_str, date_str)
         
         # Create elements with CSS-like classes
         # These classes match rules in config/styles.json
-        elements = []
+        # Time element with class "time-display" (matches .time-display in stylesheet)
+        time_x, time_y = self._time_pos
+        elements = [Element(
+            text=time_str,
+            classes=["time-display"],
+            style_overrides=self._time_overrides,
+            x=time_x,
+            y=time_y
+        )]
         
         if self.show_date:
-            # Time element with class "time-display" (matches .time-display in stylesheet)
-            time_element = Element(
-                text=time_str,
-                classes=["time-display"]
-            )
-            elements.append(time_element)
-            
             # Date element with class "date-display" (matches .date-display in stylesheet)
-            date_str = self.get_date_string()
-            date_element = Element(
+            date_x, date_y = self._date_pos
+            elements.append(Element(
                 text=date_str,
-                classes=["date-display"]
-            )
-            elements.append(date_element)
-        else:
-            # Just time, centered
-            time_element = Element(
-                text=time_str,
-                classes=["time-display"],
-                style_overrides={"gravity": "center"}  # Override to center vertically
-            )
-            elements.append(time_element)
+                classes=["date-display"],
+                x=date_x,
+                y=date_y
+            ))
         
         # Render all elements using the layout engine
-        # The layout engine will apply styles from stylesheet based on classes
-        self.layout.render(elements)
+        # The layout engine will apply styles from stylesheet based on classes.
+        # Incremental: only the glyphs that changed since this buffer was last shown are repainted
+        self.layout.render(elements, incremental=True)
     
-    def run(self, update_interval: float = 0.5):
+    def run(self, update_interval: float = 1.0):
         """
         Run the clock display continuously.
         
+        Sleeps until the next wall-clock boundary rather than a fixed delay, so
+        a new second is drawn as soon as it ticks and the loop doesn't drift.
+        
         Args:
             update_interval: How often to refresh the display in seconds.
         """
         try:
             while True:
                 self.display()
-                time.sleep(update_interval)
+                now = time.time()
+                next_tick = (math.floor(now / update_interval) + 1) * update_interval
+                # Wake just past the boundary so the new second has rolled over
+                time.sleep(next_tick - now + 0.005)
         except KeyboardInterrupt:
             self.clear()
     
     def clear(self):
         """Clear the display."""
         self.layout.clear()
+        self._last_rendered = (None, None)
+        self._last_second = None
 
 
 def run():
@@ -0,0 +1,97 @@
+"""
+Parsing helpers for flight API responses.
+Pure functions with no I/O or tracker state, fully annotated so they can be
+compiled (e.g. with mypyc) without changes.
+"""
+
+from typing import Any, Dict, Tuple
+
+# Field names flight APIs use for the origin/destination airport, in order of preference
+ORIGIN_KEYS = ("From", "from", "Orig", "origin", "dep", "Dep", "Departure", "departure",
+               "Src", "src", "Route", "route")
+DEST_KEYS = ("To", "to", "Dest", "destination", "arr", "Arr", "Arrival", "arrival", "Dst", "dst")
+# Field names for the callsign; RapidAPI falls back to the registration
+CALLSIGN_KEYS = ("Call", "callsign", "flight", "Flight")
+RAPIDAPI_CALLSIGN_KEYS = CALLSIGN_KEYS + ("reg",)
+
+RouteTuple = Tuple[str, str, str, str, str, str]
+
+
+def as_clean_str(value: Any) -> str:
+    """Get an API field as a stripped string ("" for missing/empty values)."""
+    if type(value) is str:
+        return value.strip()
+    return str(value).strip() if value else ""
+
+
+def first_nonempty(data: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """Get the value of the first key in keys with a truthy value in data, or ""."""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return ""
+
+
+def _parse_aerodatabox_endpoint(endpoint: Any) -> Tuple[Any, Any, Any]:
+    """
+    Get (airport code, city, country) from an Aerodatabox departure/arrival field.
+
+    The API returns either a nested airport (departure.airport.iata), a flat
+    endpoint (departure.iata) or just the code as a string.
+    """
+    if isinstance(endpoint, dict):
+        airport = endpoint.get("airport")
+        if isinstance(airport, dict):
+            # Nested: departure.airport.iata, with city and country
+            return (airport.get("iata") or airport.get("icao") or "",
+                    airport.get("municipalityName") or airport.get("name") or "",
+                    airport.get("countryCode") or "")
+        # Flat: departure.iata
+        return (endpoint.get("iata") or
+                endpoint.get("icao") or
+                endpoint.get("iataCode") or
+                airport or "", "", "")
+    if isinstance(endpoint, str):
+        return (endpoint, "", "")
+    return ("", "", "")
+
+
+def parse_aerodatabox_route(flight_data: Dict[str, Any]) -> RouteTuple:
+    """
+    Extract a route from one Aerodatabox flight record.
+
+    Args:
+        flight_data: Flight record (first element of the API response list)
+
+    Returns:
+        Tuple of (origin, destination, origin_city, destination_city, origin_country, destination_country),
+        each a stripped string ("" where the record has no value).
+    """
+    # Check for departure/arrival airports
+    departure = (flight_data.get("departure") or
+                 flight_data.get("dep") or
+                 flight_data.get("origin") or {})
+    arrival = (flight_data.get("arrival") or
+               flight_data.get("arr") or
+               flight_data.get("destination") or {})
+
+    origin, origin_city, origin_country = _parse_aerodatabox_endpoint(departure)
+    destination, destination_city, destination_country = _parse_aerodatabox_endpoint(arrival)
+
+    # Also try direct fields
+    if not origin:
+        origin = (flight_data.get("from") or
+                  flight_data.get("From") or
+                  flight_data.get("originIata") or
+                  flight_data.get("departureIata") or "")
+
+    if not destination:
+        destination = (flight_data.get("to") or
+                       flight_data.get("To") or
+                       flight_data.get("destinationIata") or
+                       flight_data.get("arrivalIata") or "")
+
+    return (as_clean_str(origin), as_clean_str(destination),
+            as_clean_str(origin_city), as_clean_str(destination_city),
+            as_clean_str(origin_country), as_clean_str(destination_country))
@@ -3,15 +3,23 @@ Flight Tracker module for LED matrix display.
 Fetches flight data from OpenSky Network API and displays flights near user's location.
 """
 
+import array
+import atexit
+import functools
+import heapq
 import json
 import math
 import re
+import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, List, Dict
 
 import requests
+from requests.adapters import HTTPAdapter
 from PIL import Image
 from rgbmatrix import RGBMatrix, graphics
 
@@ -23,13 +31,206 @@ from utils import (
     get_project_root,
 )
 from style_parser import create_style_manager
+from flight_parsers import (
+    CALLSIGN_KEYS,
+    DEST_KEYS,
+    ORIGIN_KEYS,
+    RAPIDAPI_CALLSIGN_KEYS,
+    as_clean_str,
+    first_nonempty,
+    parse_aerodatabox_route,
+)
+
+try:
+    import orjson
+except ImportError:
+    # Optional: stdlib json is used when orjson isn't installed
+    orjson = None
+
+
+# Font file per style font size
+_FONT_FILES = {
+    "xs": "4x6.bdf",
+    "small": "5x7.bdf",
+    "medium": "7x13.bdf",
+    "large": "7x13.bdf",
+}
+
+# (character width, height) in pixels per style font size (from the BDF file names)
+_FONT_METRICS = {
+    "xs": (4, 6),       # 4x6.bdf
+    "small": (5, 7),    # 5x7.bdf
+    "medium": (7, 13),  # 7x13.bdf
+    "large": (7, 13),   # 7x13.bdf
+}
+_DEFAULT_FONT_METRICS = (7, 13)
+
+# Airport name suffixes stripped to get a city name, e.g. "Dubai International Airport" -> "Dubai"
+_AIRPORT_SUFFIX_RE = re.compile(r'\s+(International\s+)?Airport$', re.IGNORECASE)
+_INTERNATIONAL_SUFFIX_RE = re.compile(r'\s+International$', re.IGNORECASE)
+_PARENTHESIZED_SUFFIX_RE = re.compile(r'\s*\([^)]+\)$')  # e.g. "(Fiumicino)"
+
+
+def _read_json(path) -> dict:
+    """Read a JSON file (route database, negative cache)."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _loads_json(content: bytes):
+    """Parse a JSON response body (bytes)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _dumps_json(data, indent: bool = False) -> str:
+    """Serialize to a JSON string, keeping non-ASCII characters as-is."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False)
+
+
+def _build_pulse_table(fade_down_time: float, gap_time: float, fade_up_time: float,
+                       size: int) -> array.array:
+    """
+    Precompute one icon pulse cycle as levels from 1.0 (max brightness) to 0.0 (min brightness).
+    
+    Args:
+        fade_down_time: Seconds to fade from max to min
+        gap_time: Seconds to pause at min
+        fade_up_time: Seconds to fade from min back to max
+        size: Number of samples over the cycle
+    
+    Returns:
+        array('f') of size levels, sample i taken at i / size of the cycle.
+    """
+    total_cycle = fade_down_time + gap_time + fade_up_time
+    levels = array.array('f', bytes(4 * size))
+    for i in range(size):
+        cycle_position = i * total_cycle / size
+        if cycle_position < fade_down_time:
+            # Fading down
+            levels[i] = 1.0 - cycle_position / fade_down_time
+        elif cycle_position < fade_down_time + gap_time:
+            # Gap at minimum brightness
+            levels[i] = 0.0
+        else:
+            # Fading up
+            levels[i] = (cycle_position - fade_down_time - gap_time) / fade_up_time
+    return levels
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_hex(hex_color: str) -> tuple:
+    """Parse a hex color string to an (r, g, b) tuple, once per distinct string."""
+    hex_color = hex_color.lstrip('#')
+    if len(hex_color) == 6:
+        return (int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16))
+    return (0, 255, 255)  # Default cyan
+
+
+class _CircuitBreaker:
+    """
+    Fail-fast guard around an external API.
+    
+    Closed: calls go through. After failure_threshold consecutive failures it opens
+    and refuses calls for reset_timeout seconds; then a single probe call is let
+    through (half-open). A successful probe closes it again, a failed one re-opens it
+    with the timeout doubled (up to max_reset_timeout).
+    """
+    
+    __slots__ = ("name", "failure_threshold", "min_reset_timeout", "max_reset_timeout", "reset_timeout",
+                 "state", "failure_count", "opened_at", "_lock")
+    
+    def __init__(self, name: str, failure_threshold: int = 3,
+                 reset_timeout: float = 30.0, max_reset_timeout: float = 600.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.min_reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failure_count = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """Check whether a call may go out now (admits one probe per reset_timeout while open)."""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            now = time.monotonic()
+            if now - self.opened_at >= self.reset_timeout:
+                # Restarting the timer also covers a probe that never reported back
+                self.state = "half_open"
+                self.opened_at = now
+                return True
+            return False
+    
+    def record_success(self):
+        """Close the breaker after a call that reached the API and got an answer."""
+        with self._lock:
+            self.state = "closed"
+            self.failure_count = 0
+            self.reset_timeout = self.min_reset_timeout
+    
+    def record_failure(self) -> bool:
+        """
+        Count a failed call.
+        
+        Returns:
+            True if this failure opened the breaker.
+        """
+        with self._lock:
+            if self.state == "half_open":
+                # Probe failed: stay away longer
+                self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+            else:
+                self.failure_count += 1
+                if self.state == "open" or self.failure_count < self.failure_threshold:
+                    return False
+            self.state = "open"
+            self.opened_at = time.monotonic()
+            return True
 
 
 class FlightTracker:
     """Fetches and displays flight data on the LED matrix."""
     
+    # Fixed attribute set: faster attribute access in the per-frame display() path
+    # and no per-instance __dict__. New attributes must be added here.
+    __slots__ = (
+        "aircraft_icon", "airport_cache_ttl", "animation_speed", "animation_state", "api_provider",
+        "aviation_edge_key", "canvas", "city_country_gap_size", "city_country_scroll_speed",
+        "city_country_text_cache", "color", "config", "consecutive_failures",
+        "current_flight_index", "database_path", "demo_mode", "error_cooldown",
+        "first_fetch_start_time", "flights", "has_attempted_fetch", "icon_color_rgb",
+        "last_animation_toggle", "last_error_time", "last_request_time", "last_route_sync",
+        "last_seen_flight", "last_seen_time", "last_update", "latitude", "longitude", "main_font",
+        "matrix", "min_request_interval", "project_root", "quota_error_logged", "quota_exceeded",
+        "quota_exceeded_until", "radius_km", "rapidapi_key", "route_api_provider", "route_cache",
+        "route_cache_ttl", "route_database", "route_db_save_interval", "route_negative_cache",
+        "route_negative_ttl", "route_sync_interval", "small_font", "style_manager", "styles",
+        "update_interval", "user_agent",
+        "_aerodatabox_headers", "_aircraftscatter_headers", "_airport_cache", "_airport_fetched_at",
+        "_airports_dirty", "_bbox", "_black", "_cos_lat0", "_debugged_flights", "_dirty_rows",
+        "_display_pick", "_fetch_executor", "_flight_layout", "_flight_texts", "_flights_breaker",
+        "_frame_key", "_frame_rows", "_http", "_icon_mask", "_icon_offset", "_inflight_routes",
+        "_last_aircraft_data", "_last_db_save", "_missing_aircraft_logged", "_negatives_dirty",
+        "_now", "_pending_routes", "_plane_image", "_radius_deg_sq", "_route_cache_lock",
+        "_route_db_dirty", "_route_db_proc", "_route_db_written", "_route_executor", "_route_index",
+        "_routes_breaker", "_scatter_response", "_scroll_start_time", "_stop_fetching", "_str_memo",
+        "_styles_resolved", "_tinted_icons", "_wall_now",
+    )
+    
     # RapidAPI endpoints
     API_URL_RAPIDAPI = "https://aircraftscatter.p.rapidapi.com/lat/{lat}/lon/{lon}/"
+    # Seconds an Aircraft Scatter response is reused for repeat fetches at the same location
+    SCATTER_RESPONSE_TTL = 5.0
     # Aerodatabox API for flight route lookup by flight number
     # RapidAPI version might use different format than direct API
     # Try multiple endpoint formats
@@ -37,6 +238,13 @@ class FlightTracker:
     API_URL_AERODATABOX2 = "https://aerodatabox.p.rapidapi.com/flights/search/number/{flight_number}"
     API_URL_AERODATABOX3 = "https://aerodatabox.p.rapidapi.com/flights/{flight_number}/{date}"
     
+    # Airline code (2-letter IATA or 3-letter ICAO) + flight number, e.g. "UAE81" -> ("UAE", "81")
+    _FLIGHT_NUM_RE = re.compile(r'^([A-Z]{2,3})(\d+[A-Z]?)$')
+    
+    # Where flights without a known route are remembered between runs
+    NEGATIVE_CACHE_PATH = "/dev/shm/flight_routes.neg.json"
+    AIRPORT_CACHE_PATH = "/dev/shm/flight_airports.json"
+    
     def __init__(self, matrix: RGBMatrix = None, config: dict = None, style_manager=None):
         """
         Initialize the FlightTracker display.
@@ -54,6 +262,10 @@ class FlightTracker:
 
         # Preload aircraft icon BEFORE matrix init (avoid post-init permission issues)
         self.aircraft_icon = self._load_aircraft_icon()
+        # Opacity mask of the icon (cropped to its opaque pixels) and tinted copies of it
+        # per (color, brightness level), so each frame is a single SetImage call
+        self._icon_mask, self._icon_offset = self._get_icon_mask(self.aircraft_icon)
+        self._tinted_icons: Dict[tuple, Optional[Image.Image]] = {}
 
         # Route DB path: always prefer project data/ directory
         self.database_path = self.project_root / "data" / "flight_routes.json"
@@ -66,8 +278,7 @@ class FlightTracker:
         
         for db_path in [primary_path, shm_path, tmp_path]:
             try:
-                with open(db_path, 'r', encoding='utf-8') as f:
-                    self.route_database = json.load(f)
+                self.route_database = _read_json(db_path)
                 print(f"Loaded {len(self.route_database)} routes from local database ({db_path})")
                 self.database_path = db_path
                 break
@@ -76,6 +287,39 @@ class FlightTracker:
         
         if not self.route_database:
             print("No local route database found. It will be created automatically.")
+        self._build_route_index()
+        
+        # Flight numbers Aerodatabox had no route for -> time of the miss,
+        # so unknown flights aren't re-queried on every update
+        self.route_negative_cache: Dict[str, float] = {}
+        # Retry unknown flights after 6 hours by default
+        self.route_negative_ttl = self.config.get("flight_tracker", {}).get("route_negative_ttl_seconds", 6 * 3600)
+        now = time.time()
+        for neg_path in [Path(self.NEGATIVE_CACHE_PATH), Path("/tmp/flight_routes.neg.json")]:
+            try:
+                misses = _read_json(neg_path)
+                self.route_negative_cache = {
+                    fn: seen for fn, seen in misses.items()
+                    if now - seen < self.route_negative_ttl
+                }
+                break
+            except Exception:
+                continue
+        
+        # Airport code -> (city, country) from Aviation Edge, persisted with the time each
+        # was fetched so warm restarts don't look the same airports up again
+        self._airport_cache: Dict[str, tuple] = {}
+        self._airport_fetched_at: Dict[str, float] = {}
+        self.airport_cache_ttl = 30 * 24 * 3600  # Airports rarely change; refresh after 30 days
+        for airport_path in [Path(self.AIRPORT_CACHE_PATH), Path("/tmp/flight_airports.json")]:
+            try:
+                for code, (city, country, fetched_at) in _read_json(airport_path).items():
+                    if now - fetched_at < self.airport_cache_ttl:
+                        self._airport_cache[code] = (city, country)
+                        self._airport_fetched_at[code] = fetched_at
+                break
+            except Exception:
+                continue
 
         # Load styles BEFORE matrix init (os.path.exists can fail after matrix init)
         self.styles = getattr(self.style_manager, "stylesheet", None) or self._load_styles()
@@ -104,6 +348,10 @@ class FlightTracker:
         self.latitude = flight_config.get("latitude", 0.0)
         self.longitude = flight_config.get("longitude", 0.0)
         self.radius_km = flight_config.get("radius_km", 25)
+        # Cheap in-radius pre-filter terms (see _within_radius_fast)
+        self._cos_lat0 = math.cos(math.radians(self.latitude))
+        self._radius_deg_sq = (self.radius_km / 110.0) ** 2
+        self._bbox = self._compute_bbox()
         self.update_interval = flight_config.get("update_interval_seconds", 30)
         self.animation_speed = flight_config.get("animation_speed", 0.5)
         
@@ -112,40 +360,25 @@ class FlightTracker:
         number_style = flattened_classes.get(".flight-number", {})
         icon_style = flattened_classes.get(".flight-icon", {})
         
-        # Get colors from styles (fallback to config if not in styles)
-        route_color_hex = route_style.get("color", "#00FFFF")
-        route_city_color_hex = route_city_style.get("color", "#00FFFF")
-        number_color_hex = number_style.get("color", "#00FFFF")
-        icon_color_hex = icon_style.get("color", "#0099FF")  # Default blue
-        self.route_color = self._hex_to_color(route_color_hex)
-        self.route_city_color = self._hex_to_color(route_city_color_hex)
-        self.number_color = self._hex_to_color(number_color_hex)
-        
-        # Extract RGB values for SetPixel calls
-        self.route_color_rgb = self._color_to_rgb(route_color_hex)
-        self.route_city_color_rgb = self._color_to_rgb(route_city_color_hex)
-        self.number_color_rgb = self._color_to_rgb(number_color_hex)
-        self.icon_color_rgb = self._color_to_rgb(icon_color_hex)
-        
-        # Get font sizes from styles
-        route_font_size = route_style.get("font_size", "medium")
-        route_city_font_size = route_city_style.get("font_size", "xs")
-        number_font_size = number_style.get("font_size", "small")
-        self.route_font = self._get_font(route_font_size)
-        self.route_city_font = self._get_font(route_city_font_size)
-        self.number_font = self._get_font(number_font_size)
-        # Store font sizes for height calculations
-        self.route_font_size = route_font_size
-        self.route_city_font_size = route_city_font_size
-        self.number_font_size = number_font_size
-        
-        # Get brightness from styles (0-100, default 100)
-        self.number_brightness = number_style.get("brightness", 100) / 100.0  # Convert to 0.0-1.0
-        self.route_brightness = route_style.get("brightness", 100) / 100.0  # Convert to 0.0-1.0
-        self.route_city_brightness = route_city_style.get("brightness", 100) / 100.0  # Convert to 0.0-1.0
+        # Everything the renderer needs per text style, resolved once:
+        # base rgb, brightness (0.0-1.0), dimmed graphics.Color, font and its metrics
+        self._styles_resolved = {
+            "route": self._resolve_text_style(route_style, "medium"),
+            "route_city": self._resolve_text_style(route_city_style, "xs"),
+            "number": self._resolve_text_style(number_style, "small"),
+        }
+        # Baselines of the three flight lines and the route icon row depend only on the
+        # styles and canvas height, so they're laid out once here instead of every frame
+        self._flight_layout = self._compute_flight_layout(self.canvas.height)
+        # The icon is tinted per frame (pulse), so only its base color is needed
+        self.icon_color_rgb = self._color_to_rgb(icon_style.get("color", "#0099FF"))  # Default blue
         
         # Legacy color support (from config)
         self.color = create_graphics_color(flight_config.get("color", {"r": 0, "g": 255, "b": 255}))
+        # (rgb, image) of the plane icon drawn on the last-seen screen (see _get_plane_image)
+        self._plane_image: Optional[tuple] = None
+        # Background color used to clear each frame
+        self._black = graphics.Color(0, 0, 0)
         
         # API provider
         self.api_provider = flight_config.get("api_provider", "rapidapi").lower()
@@ -155,28 +388,56 @@ class FlightTracker:
         self.aviation_edge_key = flight_config.get("aviation_edge_key", "")
         self.route_api_provider = flight_config.get("route_api_provider", "aviation_edge").lower()
         
-        # Airport cache for Aviation Edge (to avoid repeated lookups)
-        self._airport_cache = {}
+        # Airport cache for Aviation Edge already loaded before matrix init (see above)
+        # City names seen in API results, so repeated ones share a single string object
+        # (airport/country codes are sys.intern()ed instead)
+        self._str_memo: Dict[str, str] = {}
         
         # User-Agent for API requests
         self.user_agent = flight_config.get(
             "user_agent",
             "FlightTracker/1.0 (LED Matrix Display)"
         )
+        
+        # Persistent HTTP session: keep-alive connections are reused across API calls,
+        # so follow-up requests to the same host skip the TCP+TLS handshake
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+        self._http.headers.update({"User-Agent": self.user_agent})
+        atexit.register(self._http.close)
+        # RapidAPI auth headers per host, built once (the session adds the User-Agent)
+        self._aerodatabox_headers = {
+            "x-rapidapi-key": self.rapidapi_key,
+            "x-rapidapi-host": "aerodatabox.p.rapidapi.com",
+        }
+        self._aircraftscatter_headers = {
+            "x-rapidapi-key": self.rapidapi_key,
+            "x-rapidapi-host": "aircraftscatter.p.rapidapi.com",
+        }
+        # (grid cell, monotonic time, parsed body) of the last Aircraft Scatter response
+        self._scatter_response: Optional[tuple] = None
+        # Worker threads for concurrent route lookups (requests releases the GIL while waiting)
+        self._route_executor = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_LOOKUPS)
+        # Worker threads for single HTTP requests that never wait on other tasks,
+        # so route lookup workers can fan out to them without deadlocking
+        self._fetch_executor = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_LOOKUPS)
         self.demo_mode = flight_config.get("demo_mode", False)
         
         # Keep legacy fonts for error/loading messages (backward compatibility)
-        self.main_font = self.route_font  # Use route font as main
-        self.small_font = self.number_font  # Use number font as small
+        self.main_font = self._styles_resolved["route"]["font"]  # Use route font as main
+        self.small_font = self._styles_resolved["number"]["font"]  # Use number font as small
+        # Rows each screen draws into, so a frame only clears what the canvas last showed
+        self._frame_rows = self._compute_frame_rows(self.canvas.height)
         
-        # Cached flight data
+        # Cached flight data (written by the fetch thread while run() is active)
         self.flights: List[Dict] = []
+        self._stop_fetching = threading.Event()
         self.current_flight_index = 0
         self.last_update = 0
         self.last_route_sync = 0  # For periodic sync of routes to main database
         self.route_sync_interval = 60  # Sync every 60 seconds
         self.animation_state = True  # For blinking animation
-        self.last_animation_toggle = time.time()
+        self.last_animation_toggle = time.monotonic()
         
         # Last seen flight (for display when no current flights)
         self.last_seen_flight: Optional[Dict] = None
@@ -187,12 +448,33 @@ class FlightTracker:
         self.first_fetch_start_time = 0
         
         # Cache for flight route lookups (to avoid too many API calls)
-        self.route_cache: Dict[str, Dict[str, str]] = {}
-        self.route_cache_time: Dict[str, float] = {}
+        # flight number -> (monotonic time cached, route data), oldest first
+        self.route_cache: Dict[str, tuple] = {}
+        self._route_cache_lock = threading.Lock()
+        # API lookups still running, so a flight is never looked up twice at once
+        self._inflight_routes: Dict[str, Future] = {}
+        # Clocks read once per update_flights() tick and shared by every lookup in it:
+        # monotonic for in-memory TTLs, wall clock for persisted misses and the quota cooldown
+        self._now = time.monotonic()
+        self._wall_now = time.time()
         self.route_cache_ttl = 3600  # Cache routes for 1 hour
         
         # Local route database already loaded before matrix init
         # (see early loading above - file access fails after matrix init)
+        # New routes/misses only mark the files dirty; they are written at most
+        # once per route_db_save_interval (and on exit)
+        self._route_db_dirty = False
+        # Routes added since the last save; after the first full write only these are sent
+        # to the saving subprocess, which merges them into the file
+        self._pending_routes: Dict[str, Dict[str, str]] = {}
+        self._route_db_written = False
+        # Subprocess of the last route database write/merge, checked before starting the next
+        self._route_db_proc = None
+        self._negatives_dirty = False
+        self._airports_dirty = False
+        self._last_db_save = 0
+        self.route_db_save_interval = 30
+        atexit.register(self._flush_route_db)
         
         # Quota handling - stop API calls if quota exceeded
         self.quota_exceeded = False
@@ -201,6 +483,9 @@ class FlightTracker:
         
         # Error handling
         self.consecutive_failures = 0
+        # Stop calling an API that keeps failing, and probe it again with growing backoff
+        self._flights_breaker = _CircuitBreaker("Flight API")
+        self._routes_breaker = _CircuitBreaker("Route API")
         self.last_error_time = 0
         self.error_cooldown = 60  # Don't print errors more than once per minute
         
@@ -209,10 +494,18 @@ class FlightTracker:
         self.min_request_interval = 1.0  # Minimum 1 second between requests
         
         # Scrolling marquee for city/country line
-        self.city_country_scroll_position = 0
         self.city_country_scroll_speed = 20  # pixels per second
-        self.last_scroll_time = time.time()
+        # When the current text started scrolling; the position is derived from it each frame
+        self._scroll_start_time = time.monotonic()
         self.city_country_text_cache = ""  # Track when text changes to reset scroll
+        # (flights, last_seen_flight, chosen flight) of the last _pick_display_flight call
+        self._display_pick: Optional[tuple] = None
+        # (flight, canvas width, texts) of the last flight composed by _get_flight_texts
+        self._flight_texts: Optional[tuple] = None
+        # What the frame on screen shows (see _begin_frame); unchanged frames aren't redrawn
+        self._frame_key: Optional[tuple] = None
+        # id(canvas) -> (first row, end row) drawn into the last time that canvas was drawn on
+        self._dirty_rows: Dict[int, tuple] = {}
         self.city_country_gap_size = 0  # Gap in pixels between loops
     
     def _load_route_database(self):
@@ -226,52 +519,196 @@ class FlightTracker:
         
         # Try primary first (data/ directory)
         try:
-            with open(primary_path, 'r', encoding='utf-8') as f:
-                self.route_database = json.load(f)
+            self.route_database = _read_json(primary_path)
             print(f"Loaded {len(self.route_database)} routes from local database ({primary_path})")
             self.database_path = primary_path
+            self._build_route_index()
             return
         except Exception as e:
             print(f"Could not load from {primary_path}: {e}")
         
         # Fall back to /tmp
         try:
-            with open(fallback_path, 'r', encoding='utf-8') as f:
-                self.route_database = json.load(f)
+            self.route_database = _read_json(fallback_path)
             print(f"Loaded {len(self.route_database)} routes from local database ({fallback_path})")
             self.database_path = fallback_path
+            self._build_route_index()
             return
         except Exception as e:
             print(f"Could not load from {fallback_path}: {e}")
             
         # No database found
         self.route_database = {}
+        self._build_route_index()
         self.database_path = primary_path  # Will save to primary location
         print("No local route database found. It will be created automatically as routes are found.")
     
-    def _save_route_database(self):
-        """Save route database to JSON file. Called automatically after successful API lookups."""
+    def _route_aliases(self, flight_number: str) -> List[str]:
+        """Get the other airline-code forms of a flight number (e.g. "UAE81" <-> "EK81")."""
+        match = self._FLIGHT_NUM_RE.match(flight_number)
+        if not match:
+            return []
+        airline_code, flight_num = match.groups()
+        airline_code = sys.intern(airline_code)
+        alias_code = self.ICAO_TO_IATA.get(airline_code) or self.IATA_TO_ICAO.get(airline_code)
+        return [f"{alias_code}{flight_num}"] if alias_code else []
+    
+    def _build_route_index(self):
+        """Index route_database under every known flight number form, so lookups are one dict probe."""
+        self._route_index = dict(self.route_database)
+        for fn, route_data in self.route_database.items():
+            for alias in self._route_aliases(fn):
+                # A route stored under the alias itself wins
+                self._route_index.setdefault(alias, route_data)
+    
+    def _add_route(self, flight_number: str, route_data: Dict[str, str]):
+        """Add a route to the database and its lookup index, and queue it for saving."""
+        self.route_database[flight_number] = route_data
+        self._pending_routes[flight_number] = route_data
+        self._route_index[flight_number] = route_data
+        for alias in self._route_aliases(flight_number):
+            self._route_index.setdefault(alias, route_data)
+    
+    def _write_json_detached(self, path: str, payload: str):
+        """Write a JSON string to path from a short-lived subprocess, returning the process."""
         # After matrix init, rgbmatrix drops capabilities causing file write issues
         # Solution: Write to /dev/shm (RAM filesystem) which has different permission model
         import subprocess
-        try:
-            routes_json = json.dumps(self.route_database, indent=2, ensure_ascii=False)
-            shm_path = "/dev/shm/flight_routes.json"
-            
-            # Write via a Python subprocess (new process not affected by capability drops)
-            save_script = f'''
-import json
-with open("{shm_path}", "w") as f:
-    f.write({repr(routes_json)})
+        
+        # Write via a Python subprocess (new process not affected by capability drops).
+        # Written to a per-process temp file then os.replace'd, so readers (including
+        # a concurrent merge) never see a partial file
+        save_script = f'''
+import os
+tmp = "{path}." + str(os.getpid()) + ".tmp"
+with open(tmp, "w") as f:
+    f.write({repr(payload)})
+os.replace(tmp, "{path}")
 '''
-            subprocess.Popen(
-                ["python3", "-c", save_script],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
+        return subprocess.Popen(
+            ["python3", "-c", save_script],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+    
+    def _merge_json_detached(self, path: str, payload: str):
+        """
+        Merge a JSON object string into the JSON object file at path from a short-lived subprocess.
+        
+        The subprocess exits with status 1 without writing if the file is missing or
+        unreadable, rather than replacing it with just the payload.
+        
+        Returns:
+            The subprocess.Popen of the merge
+        """
+        import subprocess
+        
+        # Reading, merging and re-serializing the whole file happens in the subprocess,
+        # keeping it off the display loop; os.replace so readers never see a partial file
+        merge_script = f'''
+import json, os, sys
+try:
+    with open("{path}", encoding="utf-8") as f:
+        routes = json.load(f)
+except Exception:
+    routes = None
+if not isinstance(routes, dict):
+    sys.exit(1)
+routes.update(json.loads({repr(payload)}))
+tmp = "{path}." + str(os.getpid()) + ".tmp"
+with open(tmp, "w", encoding="utf-8") as f:
+    json.dump(routes, f, indent=2, ensure_ascii=False)
+os.replace(tmp, "{path}")
+'''
+        return subprocess.Popen(
+            ["python3", "-c", merge_script],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+    
+    def _save_route_database(self):
+        """Save route database to JSON file. Called automatically after successful API lookups."""
+        import subprocess
+        try:
+            proc = self._route_db_proc
+            if proc is not None:
+                try:
+                    # Normally long done (saves are route_db_save_interval apart)
+                    returncode = proc.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    # Still writing: overlapping it could lose one of the two writes,
+                    # so keep the pending routes for the next flush
+                    self._route_db_dirty = True
+                    return
+                if returncode != 0:
+                    # The last write failed, or the merge found the file missing or
+                    # corrupt: rewrite the full database instead of merging into it
+                    self._route_db_written = False
+            pending = dict(self._pending_routes)
+            if not self._route_db_written:
+                # First save of this run (or after a failed one): write the full database,
+                # which may include routes from data/ that the /dev/shm copy doesn't have yet
+                routes_json = _dumps_json(self.route_database, indent=True)
+                self._route_db_proc = self._write_json_detached("/dev/shm/flight_routes.json", routes_json)
+                self._route_db_written = True
+            elif pending:
+                self._route_db_proc = self._merge_json_detached("/dev/shm/flight_routes.json",
+                                                                _dumps_json(pending))
+            for fn in pending:
+                self._pending_routes.pop(fn, None)
         except Exception as e:
             print(f"Warning: Could not save route database: {e}")
     
+    def _save_negative_cache(self):
+        """Save the not-found flight cache so it survives restarts."""
+        try:
+            self._write_json_detached(self.NEGATIVE_CACHE_PATH, _dumps_json(self.route_negative_cache))
+        except Exception as e:
+            print(f"Warning: Could not save negative route cache: {e}")
+    
+    def _save_airport_cache(self) -> bool:
+        """Save fetched airport details with their fetch times so they survive restarts; False if it failed."""
+        try:
+            # Lookup worker threads add to both dicts concurrently: iterate over copies
+            cache = dict(self._airport_cache)
+            fetched_at = dict(self._airport_fetched_at)
+            airports = {
+                code: [city, country, fetched_at[code]]
+                for code, (city, country) in cache.items()
+                if code in fetched_at
+            }
+            self._write_json_detached(self.AIRPORT_CACHE_PATH, _dumps_json(airports))
+            return True
+        except Exception as e:
+            print(f"Warning: Could not save airport cache: {e}")
+            return False
+    
+    def _flush_route_db(self):
+        """Write the route database, negative cache and airport cache if they changed since the last write."""
+        if self._route_db_dirty:
+            self._route_db_dirty = False
+            self._save_route_database()
+        if self._negatives_dirty:
+            self._negatives_dirty = False
+            self._save_negative_cache()
+        if self._airports_dirty:
+            # Cleared before saving so airports cached meanwhile mark it dirty again;
+            # restored if the save didn't go out, so the next flush retries
+            self._airports_dirty = False
+            if not self._save_airport_cache():
+                self._airports_dirty = True
+        self._last_db_save = time.time()
+    
+    def _maybe_flush_route_db(self):
+        """Flush pending route database writes once route_db_save_interval has passed."""
+        proc = self._route_db_proc
+        if proc is not None and proc.poll() not in (None, 0):
+            # Last route database write/merge failed: redo it even without new routes
+            self._route_db_dirty = True
+        if ((self._route_db_dirty or self._negatives_dirty or self._airports_dirty)
+                and time.time() - self._last_db_save >= self.route_db_save_interval):
+            self._flush_route_db()
+    
     def _sync_routes_to_main_db(self):
         """Sync routes from /dev/shm to data/flight_routes.json using subprocess (avoids permission issues)."""
         import subprocess
@@ -319,62 +756,143 @@ if shm_path.exists():
     
     def _hex_to_color(self, hex_color: str) -> graphics.Color:
         """Convert hex color string to graphics.Color."""
-        hex_color = hex_color.lstrip('#')
-        if len(hex_color) == 6:
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-            return graphics.Color(r, g, b)
-        return graphics.Color(0, 255, 255)  # Default cyan
+        return graphics.Color(*_parse_hex(hex_color))
     
     def _color_to_rgb(self, hex_color: str) -> tuple:
         """Convert hex color string to (r, g, b) tuple."""
-        hex_color = hex_color.lstrip('#')
-        if len(hex_color) == 6:
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-            return (r, g, b)
-        return (0, 255, 255)  # Default cyan
+        return _parse_hex(hex_color)
+    
+    def _resolve_text_style(self, style: dict, default_font_size: str) -> dict:
+        """
+        Resolve a .flight-* class into the values display() draws with.
+        
+        Args:
+            style: Class rules from the stylesheet
+            default_font_size: Font size to use if the class doesn't set one
+        
+        Returns:
+            Dict with rgb, brightness, color (brightness applied), font,
+            font_size, height and char_width.
+        """
+        rgb = self._color_to_rgb(style.get("color", "#00FFFF"))
+        # Brightness from styles is 0-100, default 100
+        brightness = style.get("brightness", 100) / 100.0
+        font_size = style.get("font_size", default_font_size)
+        return {
+            "rgb": rgb,
+            "brightness": brightness,
+            "color": graphics.Color(*(int(c * brightness) for c in rgb)),
+            "font": self._get_font(font_size),
+            "font_size": font_size,
+            "height": self._get_font_height(font_size),
+            "char_width": self._get_font_char_width(font_size),
+        }
+    
+    def _compute_flight_layout(self, canvas_height: int) -> tuple:
+        """
+        Lay out the flight screen vertically: flight number (top), route (middle), cities (bottom).
+        
+        Args:
+            canvas_height: Canvas height in pixels
+        
+        Returns:
+            Tuple of (number_y, route_y, city_y, icon_y): text baselines and the icon's top row.
+        """
+        icon_size = 12
+        # Actual font heights of the fonts being used
+        number_font_height = self._styles_resolved["number"]["height"]
+        route_font_height = self._styles_resolved["route"]["height"]
+        city_font_height = self._styles_resolved["route_city"]["height"]
+        gap1 = 0  # Gap between flight number and route
+        gap2 = 1  # Gap between route and city/country line
+        
+        # Total content height: number + gap1 + route + gap2 + city
+        total_content_height = number_font_height + gap1 + route_font_height + gap2 + city_font_height
+        
+        # Calculate the visual center of the canvas
+        canvas_center_y = canvas_height / 2.0  # 16.0 for 32px canvas
+        
+        # Calculate the visual center of our content block
+        # Move up by 2 pixels to balance spacing (4 grids top, 2 grids bottom -> 3 grids each)
+        top_margin = canvas_center_y - (total_content_height / 2.0) - 1
+        
+        # Flight number baseline (TOP LINE)
+        number_y = int(top_margin + number_font_height)
+        
+        # Route text baseline (MIDDLE LINE)
+        route_y = int(top_margin + number_font_height + gap1 + route_font_height)
+        
+        # City/Country text baseline (BOTTOM LINE)
+        city_y = int(top_margin + number_font_height + gap1 + route_font_height + gap2 + city_font_height)
+        
+        # Icon should be vertically centered with the route text
+        # For 7x13 font, the visual center is about 6-7 pixels above baseline
+        # Position icon so its center aligns with text visual center
+        text_visual_center = route_y - 6  # Approximate visual center of text
+        icon_y = text_visual_center - icon_size // 2 + 1  # Center icon, then move 1 pixel down
+        
+        return (number_y, route_y, city_y, icon_y)
+    
+    def _compute_frame_rows(self, canvas_height: int) -> Dict[str, tuple]:
+        """
+        Get the band of rows each display() screen can draw into.
+        
+        Text at baseline y is taken to cover rows y - font height to y + 2 (descenders);
+        bands are generous since clearing extra black rows is harmless.
+        
+        Args:
+            canvas_height: Canvas height in pixels
+        
+        Returns:
+            Dict of screen name ("flight", "last", "status", "loading") to (first row, end row).
+        """
+        route_height = self._styles_resolved["route"]["height"]
+        small_height = self._styles_resolved["number"]["height"]
+        
+        def text_rows(baseline: int, font_height: int) -> tuple:
+            return (baseline - font_height, baseline + 3)
+        
+        def union(*bands: tuple) -> tuple:
+            return (max(0, min(b[0] for b in bands)), min(canvas_height, max(b[1] for b in bands)))
+        
+        number_y, route_y, city_y, icon_y = self._flight_layout
+        icon_size = 12
+        status_rows = text_rows(16, small_height)
+        loading_rows = status_rows
+        if self.aircraft_icon:
+            # Pulsing icon centered on the canvas
+            loading_top = (canvas_height - self.aircraft_icon.size[1]) // 2
+            loading_rows = (loading_top, loading_top + self.aircraft_icon.size[1])
+        return {
+            "flight": union(text_rows(number_y, small_height),
+                            text_rows(route_y, route_height),
+                            text_rows(city_y, self._styles_resolved["route_city"]["height"]),
+                            (icon_y, icon_y + icon_size)),
+            # Plane icon (rows 2-6), callsign and "Last:"
+            "last": union((2, 7), text_rows(12, route_height), text_rows(22, small_height)),
+            "status": union(status_rows),
+            "loading": union(loading_rows),
+        }
     
     def _get_font(self, font_size: str) -> graphics.Font:
         """Get font based on size name from styles."""
-        font_map = {
-            "xs": "4x6.bdf",
-            "small": "5x7.bdf",
-            "medium": "7x13.bdf",
-            "large": "7x13.bdf"
-        }
         # Prefer shared StyleManager cache to avoid file access issues after matrix init
         if self.style_manager:
             try:
                 return self.style_manager.get_font(font_size)
             except Exception:
                 pass
-        font_file = self.styles.get("font_sizes", {}).get(font_size, font_map.get(font_size, "7x13.bdf"))
+        font_file = self.styles.get("font_sizes", {}).get(font_size, _FONT_FILES.get(font_size, "7x13.bdf"))
+        # load_font keeps every font it has parsed, so this only hits the disk once per file
         return load_font(font_file)
     
     def _get_font_height(self, font_size: str) -> int:
         """Get font height in pixels based on font size name."""
-        # Map font sizes to their heights (from BDF file names)
-        height_map = {
-            "xs": 6,      # 4x6.bdf
-            "small": 7,   # 5x7.bdf
-            "medium": 13, # 7x13.bdf
-            "large": 13   # 7x13.bdf
-        }
-        return height_map.get(font_size, 13)  # Default to 13 if unknown
+        return _FONT_METRICS.get(font_size, _DEFAULT_FONT_METRICS)[1]
     
     def _get_font_char_width(self, font_size: str) -> int:
         """Get font character width in pixels based on font size name."""
-        # Map font sizes to their character widths (from BDF file names)
-        width_map = {
-            "xs": 4,      # 4x6.bdf
-            "small": 5,   # 5x7.bdf
-            "medium": 7, # 7x13.bdf
-            "large": 7    # 7x13.bdf
-        }
-        return width_map.get(font_size, 7)  # Default to 7 if unknown
+        return _FONT_METRICS.get(font_size, _DEFAULT_FONT_METRICS)[0]
     
     def _load_aircraft_icon(self) -> Optional[Image.Image]:
         """Load the aircraft icon from assets folder."""
@@ -404,6 +922,54 @@ if shm_path.exists():
             self._missing_aircraft_logged = True
         return None
     
+    def _get_icon_mask(self, icon: Optional[Image.Image]) -> tuple:
+        """
+        Get the icon's visible pixels (alpha >= 128) as a mask.
+        
+        Returns:
+            Tuple of (mask image cropped to the visible pixels, (dx, dy) of the crop),
+            or (None, (0, 0)) if there is no icon.
+        """
+        if icon is None:
+            return None, (0, 0)
+        mask = icon.getchannel("A").point(lambda a: 255 if a >= 128 else 0)
+        bbox = mask.getbbox()
+        if bbox is None:
+            return None, (0, 0)
+        return mask.crop(bbox), bbox[:2]
+    
+    # Pulse brightness is quantized to this many steps, so a color has at most this many tinted icons
+    ICON_BRIGHTNESS_LEVELS = 32
+    
+    def _get_tinted_icon(self, color_rgb: tuple, level: int) -> Optional[Image.Image]:
+        """
+        Get the icon as an RGB image in the given color and brightness (black where transparent).
+        
+        Args:
+            color_rgb: Base color as (r, g, b) tuple
+            level: Brightness step, 0 to ICON_BRIGHTNESS_LEVELS - 1
+        
+        Returns:
+            Tinted icon, or None if the color dims to black.
+        """
+        key = (color_rgb, level)
+        try:
+            return self._tinted_icons[key]
+        except KeyError:
+            pass
+        # A handful of colors at 32 levels each; start over if that ever grows
+        if len(self._tinted_icons) >= 512:
+            self._tinted_icons.clear()
+        scale = level / (self.ICON_BRIGHTNESS_LEVELS - 1)
+        r, g, b = color_rgb
+        rgb = (int(r * scale), int(g * scale), int(b * scale))
+        tinted = None
+        if rgb != (0, 0, 0):
+            tinted = Image.new("RGB", self._icon_mask.size)
+            tinted.paste(rgb, mask=self._icon_mask)
+        self._tinted_icons[key] = tinted
+        return tinted
+    
     def _draw_aircraft_icon(self, canvas, x: int, y: int, color_rgb: tuple, brightness: float = 1.0, visible: bool = True):
         """Draw the aircraft icon at the given position with optional brightness/pulse effect.
         
@@ -415,37 +981,48 @@ if shm_path.exists():
             brightness: Brightness multiplier (0.0 to 1.0) for pulse effect
             visible: Whether to draw the icon (for blink effect)
         """
-        if not visible:
-            return
-            
-        if not self.aircraft_icon:
+        if not visible or not self.aircraft_icon or self._icon_mask is None:
             return
         
-        icon_size = self.aircraft_icon.size[0]
-        r, g, b = color_rgb
+        # Apply brightness for pulse effect (quantized, so tinted icons are reused across frames)
+        self._blit_aircraft_icon(canvas, x, y, color_rgb, self._icon_level(brightness))
+    
+    def _icon_level(self, brightness: float) -> int:
+        """Quantize an icon brightness (0.0 to 1.0) to one of ICON_BRIGHTNESS_LEVELS steps."""
+        return int(brightness * (self.ICON_BRIGHTNESS_LEVELS - 1) + 0.5)
+    
+    def _blit_aircraft_icon(self, canvas, x: int, y: int, color_rgb: tuple, level: int):
+        """Draw the aircraft icon in a color at a quantized brightness level (see _icon_level)."""
+        tinted = self._get_tinted_icon(color_rgb, level)
+        
+        # Fully dimmed frame: nothing to draw on the cleared canvas
+        if tinted is None:
+            return
         
-        # Apply brightness for pulse effect
-        r = int(r * brightness)
-        g = int(g * brightness)
-        b = int(b * brightness)
-        
-        for py in range(icon_size):
-            for px in range(icon_size):
-                pixel_x = x + px
-                pixel_y = y + py
-                if 0 <= pixel_x < canvas.width and 0 <= pixel_y < canvas.height:
-                    try:
-                        pixel = self.aircraft_icon.getpixel((px, py))
-                        if len(pixel) == 4:  # RGBA
-                            _, _, _, a = pixel
-                            if a < 128:  # Skip mostly transparent pixels
-                                continue
-                        # Use the provided color with brightness applied
-                        canvas.SetPixel(pixel_x, pixel_y, r, g, b)
-                    except Exception:
-                        pass
+        # One blit of the icon in the provided color with brightness applied.
+        # Transparent pixels inside the crop are drawn black, same as the cleared background.
+        dx, dy = self._icon_offset
+        canvas.SetImage(tinted, x + dx, y + dy)
     
     def calculate_bounding_box(self) -> tuple:
+        """
+        Get the bounding box (min_lat, max_lat, min_lon, max_lon) around the center point.
+        Computed once in __init__; call invalidate_bbox() after changing location or radius.
+        
+        Returns:
+            Tuple of (min_lat, max_lat, min_lon, max_lon)
+        """
+        return self._bbox
+    
+    def invalidate_bbox(self):
+        """Recompute the bounding box and radius pre-filter terms from the current location and radius."""
+        self._cos_lat0 = math.cos(math.radians(self.latitude))
+        self._radius_deg_sq = (self.radius_km / 110.0) ** 2
+        self._bbox = self._compute_bbox()
+        # A cached response is for the old location
+        self._scatter_response = None
+    
+    def _compute_bbox(self) -> tuple:
         """
         Calculate bounding box (min_lat, max_lat, min_lon, max_lon) from center point and radius.
         
@@ -494,6 +1071,42 @@ if shm_path.exists():
         distance = R * c
         return distance
     
+    def _within_radius_fast(self, lat: float, lon: float) -> bool:
+        """
+        Equirectangular check whether a point may be within radius_km.
+        Slightly generous (110 km per degree), so it never rejects a flight
+        the Haversine distance would keep.
+        """
+        dy = lat - self.latitude
+        dx = (lon - self.longitude) * self._cos_lat0
+        return dy * dy + dx * dx <= self._radius_deg_sq
+    
+    def _calculate_distances(self, coords: List[tuple]) -> List[float]:
+        """
+        Calculate Haversine distances from the user's location to many coordinates.
+        Terms that only depend on the user's location are computed once per batch.
+        
+        Args:
+            coords: List of (latitude, longitude) tuples
+        
+        Returns:
+            Distances in kilometers, in the same order as coords.
+        """
+        R = 6371.0
+        lat1_rad = math.radians(self.latitude)
+        lon1_rad = math.radians(self.longitude)
+        cos_lat1 = math.cos(lat1_rad)
+        radians, sin, cos, atan2, sqrt = math.radians, math.sin, math.cos, math.atan2, math.sqrt
+        
+        distances = []
+        for lat2, lon2 in coords:
+            lat2_rad = radians(lat2)
+            sin_dlat = sin((lat2_rad - lat1_rad) / 2)
+            sin_dlon = sin((radians(lon2) - lon1_rad) / 2)
+            a = sin_dlat * sin_dlat + cos_lat1 * cos(lat2_rad) * sin_dlon * sin_dlon
+            distances.append(R * 2 * atan2(sqrt(a), sqrt(1 - a)))
+        return distances
+    
     # ICAO to IATA airline code mapping for common airlines
     # Aerodatabox uses IATA codes, but ADS-B transmits ICAO codes
     ICAO_TO_IATA = {
@@ -575,6 +1188,11 @@ if shm_path.exists():
         "UPS": "5X",   # UPS Airlines
         "GTI": "GT",   # Atlas Air
     }
+    # Interned so probes with interned flight codes hit the identity fast path
+    ICAO_TO_IATA = {sys.intern(k): sys.intern(v) for k, v in ICAO_TO_IATA.items()}
+    
+    # Reverse mapping, for finding routes stored under the ICAO form
+    IATA_TO_ICAO = {iata: icao for icao, iata in ICAO_TO_IATA.items()}
     
     # Country code to country name mapping (ISO 3166-1 alpha-2)
     COUNTRY_CODE_TO_NAME = {
@@ -595,6 +1213,7 @@ if shm_path.exists():
         "KE": "Kenya", "NG": "Nigeria", "GH": "Ghana", "MA": "Morocco",
         "RU": "Russia", "UA": "Ukraine", "KZ": "Kazakhstan", "UZ": "Uzbekistan",
     }
+    COUNTRY_CODE_TO_NAME = {sys.intern(k): sys.intern(v) for k, v in COUNTRY_CODE_TO_NAME.items()}
     
     # Airport code to city name mapping (for common airports)
     AIRPORT_TO_CITY = {
@@ -661,20 +1280,31 @@ if shm_path.exists():
             Tuple of (origin, destination, origin_city, destination_city, origin_country, destination_country),
             or ("", "", "", "", "", "") if not found.
         """
-        # Clean flight number (remove spaces, convert to uppercase)
+        flight_number = self._normalize_flight_number(flight_number)
+        cached = self._resolve_from_cache(flight_number)
+        if cached is not None:
+            return cached
+        inflight = self._inflight_routes.get(flight_number)
+        if inflight is not None:
+            return inflight.result()
+        return self._resolve_from_api(flight_number)
+    
+    def _normalize_flight_number(self, flight_number) -> str:
+        """Clean flight number (remove spaces, convert to uppercase)."""
         # Handle both string and other types
         if isinstance(flight_number, str):
-            flight_number = flight_number.strip().upper()
-        else:
-            flight_number = str(flight_number).strip().upper()
-        
+            return flight_number.strip().upper()
+        return str(flight_number).strip().upper()
+    
+    def _flight_numbers_to_try(self, flight_number: str) -> List[str]:
+        """Get the flight number followed by its IATA form, if it has a known ICAO airline code."""
         # Try to convert ICAO to IATA code for better compatibility
         # Extract airline code (letters at the start) and flight number (digits + optional letter at end)
-        match = re.match(r'^([A-Z]{2,3})(\d+[A-Z]?)$', flight_number)
+        match = self._FLIGHT_NUM_RE.match(flight_number)
         flight_numbers_to_try = [flight_number]  # Original first
         
         if match:
-            airline_code = match.group(1)
+            airline_code = sys.intern(match.group(1))
             flight_num = match.group(2)
             
             # If it's a 3-letter ICAO code, try IATA conversion
@@ -682,27 +1312,34 @@ if shm_path.exists():
                 iata_code = self.ICAO_TO_IATA[airline_code]
                 iata_flight = f"{iata_code}{flight_num}"
                 flight_numbers_to_try.append(iata_flight)
+        return flight_numbers_to_try
+    
+    def _resolve_from_cache(self, flight_number: str) -> Optional[tuple]:
+        """
+        Resolve a route without any API call: local database, then cache, then known misses.
         
-        # STEP 1: Check local database first (O(1) lookup, zero API calls)
-        for fn in flight_numbers_to_try:
-            if fn in self.route_database:
-                route_data = self.route_database[fn]
-                # Update cache with database result
-                self.route_cache[fn] = route_data
-                self.route_cache_time[fn] = time.time()
-                return (route_data.get("origin", ""), 
-                       route_data.get("destination", ""),
-                       route_data.get("origin_city", ""),
-                       route_data.get("destination_city", ""),
-                       route_data.get("origin_country", ""),
-                       route_data.get("destination_country", ""))
+        Args:
+            flight_number: Normalized flight number
+        
+        Returns:
+            Route tuple (all empty for a known miss), or None if the API has to be asked.
+        """
+        # STEP 1: Check local database first (one dict probe covers the ICAO and IATA forms)
+        route_data = self._route_index.get(flight_number)
+        if route_data is not None:
+            return (route_data.get("origin", ""), 
+                   route_data.get("destination", ""),
+                   route_data.get("origin_city", ""),
+                   route_data.get("destination_city", ""),
+                   route_data.get("origin_country", ""),
+                   route_data.get("destination_country", ""))
         
         # STEP 2: Check cache (for any variant)
-        for fn in flight_numbers_to_try:
-            if fn in self.route_cache:
-                cache_time = self.route_cache_time.get(fn, 0)
-                if time.time() - cache_time < self.route_cache_ttl:
-                    cached = self.route_cache[fn]
+        for fn in self._flight_numbers_to_try(flight_number):
+            entry = self.route_cache.get(fn)
+            if entry is not None:
+                cache_time, cached = entry
+                if self._now - cache_time < self.route_cache_ttl:
                     return (cached.get("origin", ""), 
                            cached.get("destination", ""),
                            cached.get("origin_city", ""),
@@ -710,10 +1347,54 @@ if shm_path.exists():
                            cached.get("origin_country", ""),
                            cached.get("destination_country", ""))
         
+        # Recently confirmed as unknown - don't ask the API again yet
+        missed_at = self.route_negative_cache.get(flight_number)
+        if missed_at is not None:
+            if self._wall_now - missed_at < self.route_negative_ttl:
+                return ("", "", "", "", "", "")
+            del self.route_negative_cache[flight_number]
+        return None
+    
+    # Most API-found routes kept in route_cache (they are in the route database as well)
+    ROUTE_CACHE_MAX_ENTRIES = 512
+    
+    def _cache_route(self, flight_number: str, route_data: Dict[str, str]):
+        """Add a route to route_cache, evicting the oldest entries beyond ROUTE_CACHE_MAX_ENTRIES."""
+        with self._route_cache_lock:
+            self.route_cache.pop(flight_number, None)
+            self.route_cache[flight_number] = (self._now, route_data)
+            while len(self.route_cache) > self.ROUTE_CACHE_MAX_ENTRIES:
+                del self.route_cache[next(iter(self.route_cache))]
+    
+    def _resolve_from_api(self, flight_number: str) -> tuple:
+        """
+        Look up a route via the configured API (the slow path of lookup_flight_route).
+        Found routes are added to the cache and database.
+        
+        Args:
+            flight_number: Normalized flight number
+        
+        Returns:
+            Route tuple, or ("", "", "", "", "", "") if not found.
+        """
+        flight_numbers_to_try = self._flight_numbers_to_try(flight_number)
+        
+        # Route API is failing repeatedly: skip the call (without caching a miss)
+        if not self._routes_breaker.allow():
+            return ("", "", "", "", "", "")
+        
         # STEP 3: Only call API as last resort (if API key available and quota not exceeded)
         # Try Aviation Edge API first if configured
         if self.route_api_provider == "aviation_edge" and self.aviation_edge_key:
             route_data = self._lookup_route_aviation_edge(flight_numbers_to_try)
+            if route_data is None:
+                self._record_breaker_failure(self._routes_breaker)
+            else:
+                self._routes_breaker.record_success()
+            if route_data is not None and not route_data[0]:
+                # Aviation Edge answered for every variant and has no route: remember it for a while
+                self._record_route_miss(flight_number)
+                return route_data
             if route_data:
                 origin, destination, origin_city, destination_city, origin_country, destination_country = route_data
                 # Save to database automatically
@@ -726,8 +1407,8 @@ if shm_path.exists():
                     "destination_country": destination_country
                 }
                 if flight_number not in self.route_database:
-                    self.route_database[flight_number] = route_dict
-                    self._save_route_database()
+                    self._add_route(flight_number, route_dict)
+                    self._route_db_dirty = True
                     print(f"DEBUG: Saved route for {flight_number} to database: {origin} -> {destination}")
                 return route_data
             # Aviation Edge failed - don't fall back to Aerodatabox if Aviation Edge is primary
@@ -739,8 +1420,7 @@ if shm_path.exists():
         
         # Check if quota is exceeded - don't make API calls
         if self.quota_exceeded:
-            current_time = time.time()
-            if current_time < self.quota_exceeded_until:
+            if self._wall_now < self.quota_exceeded_until:
                 # Still in cooldown period, return empty
                 return ("", "", "", "", "", "")
             else:
@@ -752,41 +1432,40 @@ if shm_path.exists():
         today = datetime.now().strftime("%Y-%m-%d")
         yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
         
-        headers = {
-            "x-rapidapi-key": self.rapidapi_key,
-            "x-rapidapi-host": "aerodatabox.p.rapidapi.com",
-            "User-Agent": self.user_agent
-        }
+        headers = self._aerodatabox_headers
         
         # Optimize: Only try the most reliable endpoint first
         # Only try additional endpoints if the first one fails
         # This reduces API calls from ~10 per flight to ~1-2 per flight
+        # Fallback endpoints are only reached when the ones before them fail
         endpoints_to_try = [
             (self.API_URL_AERODATABOX1, today),  # Most reliable endpoint with today's date
+            (self.API_URL_AERODATABOX1, yesterday),  # Try yesterday if today fails
+            (self.API_URL_AERODATABOX2, None),  # Alternative endpoint format
         ]
         
-        # Only try more endpoints if first attempt fails AND quota not exceeded
-        if not self.quota_exceeded:
-            # Add fallback endpoints (only if needed)
-            endpoints_to_try.extend([
-                (self.API_URL_AERODATABOX1, yesterday),  # Try yesterday if today fails
-                (self.API_URL_AERODATABOX2, None),  # Alternative endpoint format
-            ])
-        
         first_attempt = True
-        # Try original flight number first, only try IATA conversion if original fails
-        # This reduces calls from 2 variants × 5 endpoints = 10 calls to ~1-3 calls
-        for fn_to_try in flight_numbers_to_try:
-            for endpoint_template, date_str in endpoints_to_try:
+        backoff = False
+        # Set when an attempt failed for a reason that may go away (5xx, auth, network)
+        transient_failure = False
+        # Both flight number variants are tried on the most reliable endpoint before
+        # falling back to the others: ADS-B callsigns are ICAO ("UAE81") while
+        # Aerodatabox mostly knows IATA ("EK81"), so the hit is usually the second call.
+        # The first valid route returns immediately.
+        for endpoint_template, date_str in endpoints_to_try:
+            for fn_to_try in flight_numbers_to_try:
                 if date_str:
                     url = endpoint_template.format(flight_number=fn_to_try, date=date_str)
                 else:
                     url = endpoint_template.format(flight_number=fn_to_try)
                 try:
-                    # Add a small delay to avoid rate limits
-                    time.sleep(0.3)
+                    # Small delay between follow-up calls to avoid rate limits
+                    # (the first call goes out immediately)
+                    if backoff:
+                        time.sleep(0.3)
+                    backoff = True
                     
-                    response = requests.get(url, headers=headers, timeout=10)
+                    response = self._http.get(url, headers=headers, timeout=10)
                     
                     # Debug: Print response status
                     if response.status_code == 204:
@@ -809,6 +1488,8 @@ if shm_path.exists():
                         return ("", "", "", "", "", "")
                     
                     if response.status_code != 200:
+                        if response.status_code != 404:
+                            transient_failure = True
                         if first_attempt:
                             print(f"DEBUG: Aerodatabox API returned status {response.status_code} for flight {fn_to_try}")
                             print(f"  URL: {url}")
@@ -817,16 +1498,8 @@ if shm_path.exists():
                         continue  # Try next endpoint
                     
                     if response.status_code == 200:
-                        data = response.json()
+                        data = _loads_json(response.content)
                         
-                        # Parse the response - format may vary
-                        origin = ""
-                        destination = ""
-                        origin_city = ""
-                        destination_city = ""
-                        origin_country = ""
-                        destination_country = ""
-                    
                         # Try different response structures
                         if isinstance(data, list) and len(data) > 0:
                             flight_data = data[0]
@@ -835,92 +1508,15 @@ if shm_path.exists():
                         else:
                             continue  # Try next endpoint
                         
-                        # Try to extract origin and destination
-                        # Check for departure/arrival airports
-                        departure = (flight_data.get("departure") or 
-                                    flight_data.get("dep") or 
-                                    flight_data.get("origin") or {})
-                        arrival = (flight_data.get("arrival") or 
-                                  flight_data.get("arr") or 
-                                  flight_data.get("destination") or {})
-                        
-                        # Get airport codes and location info - handle nested structure
-                        # API returns: departure.airport.iata or just departure.iata
-                        if isinstance(departure, dict):
-                            airport = departure.get("airport")
-                            if isinstance(airport, dict):
-                                # Nested: departure.airport.iata
-                                origin = airport.get("iata") or airport.get("icao") or ""
-                                # Extract city and country
-                                origin_city = airport.get("municipalityName") or airport.get("name") or ""
-                                origin_country = airport.get("countryCode") or ""
-                            else:
-                                # Flat: departure.iata
-                                origin = (departure.get("iata") or 
-                                         departure.get("icao") or 
-                                         departure.get("iataCode") or 
-                                         airport or "")
-                        elif isinstance(departure, str):
-                            origin = departure
-                        
-                        if isinstance(arrival, dict):
-                            airport = arrival.get("airport")
-                            if isinstance(airport, dict):
-                                # Nested: arrival.airport.iata
-                                destination = airport.get("iata") or airport.get("icao") or ""
-                                # Extract city and country
-                                destination_city = airport.get("municipalityName") or airport.get("name") or ""
-                                destination_country = airport.get("countryCode") or ""
-                            else:
-                                # Flat: arrival.iata
-                                destination = (arrival.get("iata") or 
-                                              arrival.get("icao") or 
-                                              arrival.get("iataCode") or 
-                                              airport or "")
-                        elif isinstance(arrival, str):
-                            destination = arrival
-                        
-                        # Also try direct fields
-                        if not origin:
-                            origin = (flight_data.get("from") or 
-                                     flight_data.get("From") or 
-                                     flight_data.get("originIata") or 
-                                     flight_data.get("departureIata") or "")
-                        
-                        if not destination:
-                            destination = (flight_data.get("to") or 
-                                         flight_data.get("To") or 
-                                         flight_data.get("destinationIata") or 
-                                         flight_data.get("arrivalIata") or "")
-                        
-                        # Ensure origin and destination are strings before stripping
-                        if isinstance(origin, str):
-                            origin = origin.strip()
-                        elif origin:
-                            origin = str(origin).strip()
-                        else:
-                            origin = ""
-                        
-                        if isinstance(destination, str):
-                            destination = destination.strip()
-                        elif destination:
-                            destination = str(destination).strip()
-                        else:
-                            destination = ""
-                        
-                        # Clean city and country strings
-                        if isinstance(origin_city, str):
-                            origin_city = origin_city.strip()
-                        else:
-                            origin_city = str(origin_city).strip() if origin_city else ""
-                        
-                        if isinstance(destination_city, str):
-                            destination_city = destination_city.strip()
-                        else:
-                            destination_city = str(destination_city).strip() if destination_city else ""
-                        
-                        origin_country = origin_country.strip() if isinstance(origin_country, str) else str(origin_country).strip() if origin_country else ""
-                        destination_country = destination_country.strip() if isinstance(destination_country, str) else str(destination_country).strip() if destination_country else ""
+                        origin, destination, origin_city, destination_city, origin_country, destination_country = \
+                            parse_aerodatabox_route(flight_data)
+                        # Share one string object per distinct code/city across cached routes
+                        origin = sys.intern(origin)
+                        destination = sys.intern(destination)
+                        origin_city = self._str_memo.setdefault(origin_city, origin_city)
+                        destination_city = self._str_memo.setdefault(destination_city, destination_city)
+                        origin_country = sys.intern(origin_country)
+                        destination_country = sys.intern(destination_country)
                         
                         # Cache the result (using original flight number as key)
                         if origin or destination:
@@ -934,28 +1530,30 @@ if shm_path.exists():
                             }
                             
                             # Save to cache
-                            self.route_cache[flight_number] = route_data
-                            self.route_cache_time[flight_number] = time.time()
+                            self._cache_route(flight_number, route_data)
                             
-                            # Save to database for future lookups (auto-populate over time)
-                            if flight_number not in self.route_database:
-                                self.route_database[flight_number] = route_data
-                                self._save_route_database()
+                            # Save to database for future lookups (auto-populate over time),
+                            # also under the variant if different (e.g., IATA vs ICAO)
+                            new_keys = [fn for fn in dict.fromkeys((flight_number, fn_to_try))
+                                        if fn not in self.route_database]
+                            for fn in new_keys:
+                                self._add_route(fn, route_data)
+                            if new_keys:
+                                # One pending write for both keys
+                                self._route_db_dirty = True
+                            if flight_number in new_keys:
                                 print(f"DEBUG: Saved route for {flight_number} to database: {origin} -> {destination}")
                             
-                            # Also save variant if different (e.g., IATA vs ICAO)
-                            if fn_to_try != flight_number and fn_to_try not in self.route_database:
-                                self.route_database[fn_to_try] = route_data
-                                self._save_route_database()
-                            
                             if fn_to_try != flight_number:
                                 print(f"DEBUG: Found route for {flight_number} (via {fn_to_try}): {origin} -> {destination}")
                             else:
                                 print(f"DEBUG: Found route for {flight_number}: {origin} -> {destination}")
                             
+                            self._routes_breaker.record_success()
                             return (origin, destination, origin_city, destination_city, origin_country, destination_country)
                         
                 except Exception as e:
+                    transient_failure = True
                     if first_attempt:
                         print(f"DEBUG: Error trying endpoint for {fn_to_try}: {e}")
                         first_attempt = False
@@ -964,8 +1562,68 @@ if shm_path.exists():
         # All endpoints failed (only print once)
         if flight_number not in self.route_cache:  # Don't spam if we've seen this flight before
             print(f"DEBUG: All Aerodatabox endpoints failed for flight {flight_number}")
+        # Every endpoint answered "not found": remember it for a while
+        if transient_failure:
+            self._record_breaker_failure(self._routes_breaker)
+        else:
+            self._routes_breaker.record_success()
+            self._record_route_miss(flight_number)
         return ("", "", "", "", "", "")
     
+    def _record_route_miss(self, flight_number: str):
+        """Remember that no route exists for a flight number, so it isn't looked up again until route_negative_ttl passes."""
+        self.route_negative_cache[flight_number] = self._wall_now
+        self._negatives_dirty = True
+    
+    # Route lookups allowed in flight at once (keeps RapidAPI QPS reasonable)
+    MAX_CONCURRENT_LOOKUPS = 4
+    
+    def lookup_flight_routes(self, flight_numbers: List[str]) -> Dict[str, tuple]:
+        """
+        Look up routes for several flights at once.
+        Flights resolved from the database/cache return immediately; the rest
+        are looked up concurrently, so the wait is roughly the slowest API
+        lookup rather than the sum of all of them.
+        
+        Args:
+            flight_numbers: Flight numbers to look up (duplicates are looked up once)
+        
+        Returns:
+            Dict mapping each flight number to its lookup_flight_route() tuple.
+        """
+        routes = self._start_route_lookups(flight_numbers)
+        return {
+            fn: route.result() if isinstance(route, Future) else route
+            for fn, route in routes.items()
+        }
+    
+    def _start_route_lookups(self, flight_numbers: List[str]) -> Dict[str, object]:
+        """
+        Resolve cached routes right away and start API lookups for the rest in the background.
+        
+        Args:
+            flight_numbers: Flight numbers to look up (duplicates are looked up once)
+        
+        Returns:
+            Dict mapping each flight number to its route tuple, or to a Future of it
+            while the API lookup is still running.
+        """
+        routes = {}
+        for fn in dict.fromkeys(flight_numbers):
+            flight_number = self._normalize_flight_number(fn)
+            cached = self._resolve_from_cache(flight_number)
+            if cached is not None:
+                routes[fn] = cached
+                continue
+            # Join a lookup still running from an earlier update instead of starting another
+            future = self._inflight_routes.get(flight_number)
+            if future is None:
+                future = self._route_executor.submit(self._resolve_from_api, flight_number)
+                self._inflight_routes[flight_number] = future
+                future.add_done_callback(lambda _, fn=flight_number: self._inflight_routes.pop(fn, None))
+            routes[fn] = future
+        return routes
+    
     def _lookup_route_aviation_edge(self, flight_numbers_to_try: List[str]) -> Optional[tuple]:
         """
         Look up flight route using Aviation Edge API.
@@ -976,47 +1634,117 @@ if shm_path.exists():
         
         Returns:
             Tuple of (origin, destination, origin_city, destination_city, origin_country, destination_country),
-            or None if not found.
+            an all-empty tuple if Aviation Edge has no route for any variant,
+            or None if a variant could not be checked (request error or non-200 response).
         """
-        for flight_number in flight_numbers_to_try:
-            try:
-                # Extract airline code and flight number
-                match = re.match(r'^([A-Z]{2,3})(\d+[A-Z]?)$', flight_number)
-                if not match:
-                    continue
-                
-                airline_code = match.group(1)
-                flight_num = match.group(2)
-                
-                # Convert 3-letter ICAO to 2-letter IATA if needed
-                if len(airline_code) == 3 and airline_code in self.ICAO_TO_IATA:
-                    airline_code = self.ICAO_TO_IATA[airline_code]
-                
-                # Use /routes endpoint with airlineIata and flightNumber
-                url = f"https://aviation-edge.com/v2/public/routes?key={self.aviation_edge_key}&airlineIata={airline_code}&flightNumber={flight_num}"
-                response = requests.get(url, timeout=10)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if isinstance(data, list) and len(data) > 0:
-                        # Take the first route result
-                        route = data[0]
-                        
-                        origin = route.get("departureIata", "").strip()
-                        destination = route.get("arrivalIata", "").strip()
-                        
-                        if origin and destination:
-                            # Look up airport details for city/country
-                            origin_city, origin_country = self._get_airport_details(origin)
-                            dest_city, dest_country = self._get_airport_details(destination)
-                            
-                            return (origin, destination, origin_city, dest_city, origin_country, dest_country)
-                
-            except Exception as e:
-                # Continue to next variant
+        # Variants that map to the same airlineIata/flightNumber (e.g. UAE215 and EK215)
+        # are the same billed request: query each distinct one once
+        queries = {}
+        for fn in flight_numbers_to_try:
+            queries.setdefault(self._aviation_edge_query(fn), fn)
+        variants = list(queries.values())
+        
+        # Query every variant at once and use the first one that has the route
+        if len(variants) == 1:
+            answers = [self._query_aviation_edge_route(variants[0])]
+        else:
+            futures = [self._fetch_executor.submit(self._query_aviation_edge_route, fn)
+                       for fn in variants]
+            answers = []
+            for future in as_completed(futures):
+                answers.append(future.result())
+                if answers[-1] and answers[-1][0] and answers[-1][1]:
+                    for other in futures:
+                        other.cancel()
+                    break
+        
+        failed = False
+        for answer in answers:
+            if answer is None:
+                failed = True
                 continue
+            origin, destination = answer
+            if origin and destination:
+                # Look up airport details for city/country
+                (origin_city, origin_country), (dest_city, dest_country) = \
+                    self._get_airport_details_pair(origin, destination)
+                
+                return (origin, destination, origin_city, dest_city, origin_country, dest_country)
         
-        return None
+        return None if failed else ("", "", "", "", "", "")
+    
+    def _aviation_edge_query(self, flight_number: str) -> Optional[tuple]:
+        """Get the (airlineIata, flightNumber) Aviation Edge is queried with, or None if unparseable."""
+        match = self._FLIGHT_NUM_RE.match(flight_number)
+        if not match:
+            return None
+        airline_code = sys.intern(match.group(1))
+        # Convert 3-letter ICAO to 2-letter IATA if needed
+        if len(airline_code) == 3 and airline_code in self.ICAO_TO_IATA:
+            airline_code = self.ICAO_TO_IATA[airline_code]
+        return (airline_code, match.group(2))
+    
+    def _query_aviation_edge_route(self, flight_number: str) -> Optional[tuple]:
+        """
+        Query the Aviation Edge /routes endpoint for one flight number variant.
+        
+        Args:
+            flight_number: Flight number variant (e.g. "EK215")
+        
+        Returns:
+            Tuple of (origin, destination), ("", "") if there is no route for it,
+            or None if the request failed.
+        """
+        try:
+            # Extract airline code (as IATA) and flight number
+            query = self._aviation_edge_query(flight_number)
+            if query is None:
+                return ("", "")
+            airline_code, flight_num = query
+            
+            # Use /routes endpoint with airlineIata and flightNumber
+            url = f"https://aviation-edge.com/v2/public/routes?key={self.aviation_edge_key}&airlineIata={airline_code}&flightNumber={flight_num}"
+            response = self._http.get(url, timeout=10)
+            
+            if response.status_code != 200:
+                return None
+            data = _loads_json(response.content)
+            if isinstance(data, list) and len(data) > 0:
+                # Take the first route result
+                route = data[0]
+                return (as_clean_str(route.get("departureIata")), as_clean_str(route.get("arrivalIata")))
+            return ("", "")
+        except Exception:
+            return None
+    
+    def _cache_airport(self, airport_code: str, city: str, country: str, persist: bool = True):
+        """Cache airport details in memory, and on disk if the lookup succeeded (and persist is set)."""
+        city = self._str_memo.setdefault(city, city)
+        country = sys.intern(country)
+        self._airport_cache[airport_code] = (city, country)
+        if persist and (city or country):
+            self._airport_fetched_at[airport_code] = time.time()
+            self._airports_dirty = True
+    
+    def _get_airport_details_pair(self, origin: str, destination: str) -> tuple:
+        """
+        Get airport details for both ends of a route, fetching them concurrently
+        when neither is cached.
+        
+        Args:
+            origin: IATA code of the origin airport
+            destination: IATA code of the destination airport
+        
+        Returns:
+            Tuple of ((origin_city, origin_country), (dest_city, dest_country))
+        """
+        if (not origin or not destination or origin == destination
+                or origin in self._airport_cache or destination in self._airport_cache):
+            return (self._get_airport_details(origin), self._get_airport_details(destination))
+        
+        origin_future = self._fetch_executor.submit(self._get_airport_details, origin)
+        dest_details = self._get_airport_details(destination)
+        return (origin_future.result(), dest_details)
     
     def _get_airport_details(self, airport_code: str) -> tuple:
         """
@@ -1044,14 +1772,16 @@ if shm_path.exists():
             try:
                 if self.aviation_edge_key:
                     url = f"https://aviation-edge.com/v2/public/airportDatabase?key={self.aviation_edge_key}&codeIataAirport={airport_code}"
-                    response = requests.get(url, timeout=5)
+                    response = self._http.get(url, timeout=5)
                     if response.status_code == 200:
-                        data = response.json()
+                        data = _loads_json(response.content)
                         if isinstance(data, list) and len(data) > 0:
-                            country = data[0].get("codeIso2Country", "").strip()
+                            country = as_clean_str(data[0].get("codeIso2Country"))
             except Exception:
                 pass
-            self._airport_cache[airport_code] = (city, country)
+            # The city is local; only a country from a successful lookup is worth saving
+            # (a failed one is retried after a restart instead of kept for airport_cache_ttl)
+            self._cache_airport(airport_code, city, country, persist=bool(country))
             return (city, country)
         
         # Fall back to API lookup
@@ -1060,30 +1790,35 @@ if shm_path.exists():
         
         try:
             url = f"https://aviation-edge.com/v2/public/airportDatabase?key={self.aviation_edge_key}&codeIataAirport={airport_code}"
-            response = requests.get(url, timeout=10)
+            response = self._http.get(url, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _loads_json(response.content)
                 if isinstance(data, list) and len(data) > 0:
                     airport = data[0]
                     
                     # Get airport name and try to clean it
-                    airport_name = airport.get("nameAirport", "").strip()
+                    airport_name = as_clean_str(airport.get("nameAirport"))
                     city = airport_name
                     
                     # Remove common airport suffixes to get city name
-                    city = re.sub(r'\s+(International\s+)?Airport$', '', city, flags=re.IGNORECASE)
-                    city = re.sub(r'\s+International$', '', city, flags=re.IGNORECASE)
-                    city = re.sub(r'\s*\([^)]+\)$', '', city)  # Remove parentheses like "(Fiumicino)"
+                    # (substring checks skip the regexes for names without them)
+                    lowered = city.lower()
+                    if "airport" in lowered:
+                        city = _AIRPORT_SUFFIX_RE.sub('', city)
+                    if "international" in lowered:
+                        city = _INTERNATIONAL_SUFFIX_RE.sub('', city)
+                    if city.endswith(')'):
+                        city = _PARENTHESIZED_SUFFIX_RE.sub('', city)
                     
                     # If after cleaning it's empty or too short, use the original
                     if not city or len(city) < 2:
                         city = airport_name
                     
-                    country = airport.get("codeIso2Country", "").strip()
+                    country = as_clean_str(airport.get("codeIso2Country"))
                     
                     # Cache the result
-                    self._airport_cache[airport_code] = (city, country)
+                    self._cache_airport(airport_code, city, country)
                     return (city, country)
         except Exception:
             pass
@@ -1116,14 +1851,11 @@ if shm_path.exists():
             },
         ]
         
-        headers = {"User-Agent": self.user_agent}
-        
         for endpoint in endpoints_to_try:
             try:
-                response = requests.get(
+                response = self._http.get(
                     endpoint["url"],
                     params=endpoint["params"],
-                    headers=headers,
                     timeout=10
                 )
                 
@@ -1136,7 +1868,7 @@ if shm_path.exists():
                     continue
                 
                 try:
-                    data = response.json()
+                    data = _loads_json(response.content)
                 except ValueError:
                     # Not valid JSON, try next endpoint
                     continue
@@ -1153,16 +1885,14 @@ if shm_path.exists():
                 if not aircraft_list:
                     continue
                 
-                flights = []
+                # Airborne aircraft with a position; their distances are computed in one batch
+                airborne = []
                 for aircraft in aircraft_list:
                     if not isinstance(aircraft, dict):
                         continue
                     
                     # Try different field names for callsign
-                    callsign = (aircraft.get("Call") or 
-                               aircraft.get("callsign") or 
-                               aircraft.get("flight") or 
-                               aircraft.get("Flight")).strip() if aircraft.get("Call") or aircraft.get("callsign") or aircraft.get("flight") or aircraft.get("Flight") else ""
+                    callsign = first_nonempty(aircraft, CALLSIGN_KEYS).strip()
                     
                     if not callsign:
                         continue
@@ -1177,55 +1907,34 @@ if shm_path.exists():
                                 aircraft.get("on_ground", False) or 
                                 alt < 100)
                     
-                    if not on_ground:
-                        aircraft_lat = aircraft.get("Lat") or aircraft.get("lat")
-                        aircraft_lon = aircraft.get("Long") or aircraft.get("lon")
-                        
-                        if aircraft_lat and aircraft_lon:
-                            # Calculate distance from user's location
-                            distance = self._calculate_distance(
-                                self.latitude, self.longitude,
-                                aircraft_lat, aircraft_lon
-                            )
-                            
-                        # Try to get origin and destination - check many possible field names
-                        origin = (aircraft.get("From") or 
-                                 aircraft.get("from") or 
-                                 aircraft.get("Orig") or 
-                                 aircraft.get("origin") or 
-                                 aircraft.get("dep") or
-                                 aircraft.get("Dep") or
-                                 aircraft.get("Departure") or
-                                 aircraft.get("departure") or
-                                 aircraft.get("Src") or
-                                 aircraft.get("src") or
-                                 aircraft.get("Route") or
-                                 aircraft.get("route") or "")
-                        destination = (aircraft.get("To") or 
-                                      aircraft.get("to") or 
-                                      aircraft.get("Dest") or 
-                                      aircraft.get("destination") or 
-                                      aircraft.get("arr") or
-                                      aircraft.get("Arr") or
-                                      aircraft.get("Arrival") or
-                                      aircraft.get("arrival") or
-                                      aircraft.get("Dst") or
-                                      aircraft.get("dst") or "")
-                        
-                        flights.append({
-                            "callsign": callsign,
-                            "latitude": aircraft_lat,
-                            "longitude": aircraft_lon,
-                            "altitude": alt,
-                            "distance": distance,
-                            "origin": origin.strip() if isinstance(origin, str) and origin else str(origin).strip() if origin else "",
-                            "destination": destination.strip() if isinstance(destination, str) and destination else str(destination).strip() if destination else "",
-                        })
+                    if on_ground:
+                        continue
+                    
+                    aircraft_lat = aircraft.get("Lat") or aircraft.get("lat")
+                    aircraft_lon = aircraft.get("Long") or aircraft.get("lon")
+                    if aircraft_lat and aircraft_lon:
+                        airborne.append((aircraft, callsign, alt, aircraft_lat, aircraft_lon))
                 
                 # Return only the closest flight
-                if flights:
-                    flights.sort(key=lambda x: x.get("distance", float('inf')))
-                    closest_flight = flights[0]
+                if airborne:
+                    # Distances from user's location in one pass; only the closest flight is built
+                    distances = self._calculate_distances([(lat, lon) for _, _, _, lat, lon in airborne])
+                    closest = min(range(len(airborne)), key=distances.__getitem__)
+                    aircraft, callsign, alt, aircraft_lat, aircraft_lon = airborne[closest]
+                    
+                    # Try to get origin and destination - check many possible field names
+                    origin = first_nonempty(aircraft, ORIGIN_KEYS)
+                    destination = first_nonempty(aircraft, DEST_KEYS)
+                    
+                    closest_flight = {
+                        "callsign": callsign,
+                        "latitude": aircraft_lat,
+                        "longitude": aircraft_lon,
+                        "altitude": alt,
+                        "distance": distances[closest],
+                        "origin": sys.intern(as_clean_str(origin)),
+                        "destination": sys.intern(as_clean_str(destination)),
+                    }
                     
                     # Preserve any origin/destination from the initial API response
                     existing_origin = closest_flight.get("origin", "")
@@ -1236,8 +1945,8 @@ if shm_path.exists():
                     if existing_origin and existing_destination:
                         # API already has the codes - just get city/country details
                         if not closest_flight.get("origin_city") or not closest_flight.get("destination_city"):
-                            origin_city, origin_country = self._get_airport_details(existing_origin)
-                            dest_city, dest_country = self._get_airport_details(existing_destination)
+                            (origin_city, origin_country), (dest_city, dest_country) = \
+                                self._get_airport_details_pair(existing_origin, existing_destination)
                             if origin_city:
                                 closest_flight["origin_city"] = origin_city
                             if origin_country:
@@ -1327,16 +2036,20 @@ if shm_path.exists():
             return None
         
         try:
-            url = self.API_URL_RAPIDAPI.format(lat=self.latitude, lon=self.longitude)
-            headers = {
-                "x-rapidapi-key": self.rapidapi_key,
-                "x-rapidapi-host": "aircraftscatter.p.rapidapi.com",
-                "User-Agent": self.user_agent
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            # Fetches within a few seconds of each other (e.g. a forced update right after a
+            # scheduled one) reuse the last response for the same ~1 km grid cell
+            grid_key = (round(self.latitude, 2), round(self.longitude, 2))
+            fetched_at = time.monotonic()
+            cached = self._scatter_response
+            if (cached is not None and cached[0] == grid_key
+                    and fetched_at - cached[1] < self.SCATTER_RESPONSE_TTL):
+                data = cached[2]
+            else:
+                url = self.API_URL_RAPIDAPI.format(lat=self.latitude, lon=self.longitude)
+                response = self._http.get(url, headers=self._aircraftscatter_headers, timeout=10)
+                response.raise_for_status()
+                data = _loads_json(response.content)
+                self._scatter_response = (grid_key, fetched_at, data)
             
             # Parse the response - format may vary, let's handle common structures
             flights = []
@@ -1361,11 +2074,7 @@ if shm_path.exists():
                 
                 # Try different field names for callsign
                 # Note: "flight" field in RapidAPI has trailing spaces, so strip it
-                callsign = (aircraft.get("Call") or 
-                           aircraft.get("callsign") or 
-                           aircraft.get("flight") or 
-                           aircraft.get("Flight") or
-                           aircraft.get("reg") or "").strip()
+                callsign = first_nonempty(aircraft, RAPIDAPI_CALLSIGN_KEYS).strip()
                 
                 if not callsign:
                     continue
@@ -1382,71 +2091,69 @@ if shm_path.exists():
                             aircraft.get("ground", False) or
                             alt < 100)
                 
-                if not on_ground:
-                    # Calculate distance from user's location
-                    # RapidAPI uses lowercase "lat" and "lon"
-                    aircraft_lat = aircraft.get("lat") or aircraft.get("Lat")
-                    aircraft_lon = aircraft.get("lon") or aircraft.get("Long")
-                    
-                    if aircraft_lat and aircraft_lon:
-                        # Calculate distance in km using Haversine formula
-                        distance = self._calculate_distance(
-                            self.latitude, self.longitude,
-                            aircraft_lat, aircraft_lon
-                        )
-                        
-                        # Try to get origin and destination - check many possible field names
-                        origin = (aircraft.get("From") or 
-                                 aircraft.get("from") or 
-                                 aircraft.get("Orig") or 
-                                 aircraft.get("origin") or 
-                                 aircraft.get("dep") or
-                                 aircraft.get("Dep") or
-                                 aircraft.get("Departure") or
-                                 aircraft.get("departure") or
-                                 aircraft.get("Src") or
-                                 aircraft.get("src") or
-                                 aircraft.get("Route") or
-                                 aircraft.get("route") or "")
-                        destination = (aircraft.get("To") or 
-                                      aircraft.get("to") or 
-                                      aircraft.get("Dest") or 
-                                      aircraft.get("destination") or 
-                                      aircraft.get("arr") or
-                                      aircraft.get("Arr") or
-                                      aircraft.get("Arrival") or
-                                      aircraft.get("arrival") or
-                                      aircraft.get("Dst") or
-                                      aircraft.get("dst") or "")
-                        
-                        # Store raw aircraft data for debugging
-                        self._last_aircraft_data = aircraft
-                        
-                        flights.append({
-                            "callsign": callsign,
-                            "latitude": aircraft_lat,
-                            "longitude": aircraft_lon,
-                            "altitude": alt,
-                            "distance": distance,
-                            "origin": origin.strip() if isinstance(origin, str) and origin else str(origin).strip() if origin else "",
-                            "destination": destination.strip() if isinstance(destination, str) and destination else str(destination).strip() if destination else "",
-                            "last_contact": aircraft.get("PosTime") or aircraft.get("last_contact") or time.time()
-                        })
+                # Grounded aircraft are skipped before any position/route work
+                if on_ground:
+                    continue
+                
+                # RapidAPI uses lowercase "lat" and "lon"
+                aircraft_lat = aircraft.get("lat") or aircraft.get("Lat")
+                aircraft_lon = aircraft.get("lon") or aircraft.get("Long")
+                
+                # Reject missing positions and obvious far-away flights without any trig
+                if not (aircraft_lat and aircraft_lon) or not self._within_radius_fast(aircraft_lat, aircraft_lon):
+                    continue
+                
+                # Distance is filled in for all flights at once after the loop
+                distance = None
+                
+                # Try to get origin and destination - check many possible field names
+                origin = first_nonempty(aircraft, ORIGIN_KEYS)
+                destination = first_nonempty(aircraft, DEST_KEYS)
+                
+                # Store raw aircraft data for debugging
+                self._last_aircraft_data = aircraft
+                
+                flights.append({
+                    "callsign": callsign,
+                    "latitude": aircraft_lat,
+                    "longitude": aircraft_lon,
+                    "altitude": alt,
+                    "distance": distance,
+                    "origin": sys.intern(as_clean_str(origin)),
+                    "destination": sys.intern(as_clean_str(destination)),
+                    "last_contact": aircraft.get("PosTime") or aircraft.get("last_contact") or time.time()
+                })
             
-            # Sort by distance (closest first) and try to find one with valid route
             if flights:
-                flights.sort(key=lambda x: x.get("distance", float('inf')))
-                
-                # Try up to 10 closest flights to find one with a valid route
-                for flight in flights[:10]:
+                # Accurate distances from user's location in one pass, then drop anything outside the radius
+                distances = self._calculate_distances([(f["latitude"], f["longitude"]) for f in flights])
+                for flight, distance in zip(flights, distances):
+                    flight["distance"] = distance
+                flights = [f for f in flights if f["distance"] <= self.radius_km]
+            
+            # Try up to 10 closest flights (closest first) to find one with a valid route;
+            # only those 10 are ordered, not every flight in range
+            if flights:
+                candidates = heapq.nsmallest(10, flights, key=lambda x: x["distance"])
+                # Start every missing route lookup at once; each candidate below only waits
+                # for its own lookup, so a close flight with a known route returns without
+                # waiting on lookups for flights further away (they finish in the background)
+                routes = self._start_route_lookups([
+                    flight["callsign"] for flight in candidates
+                    if flight.get("callsign") and not (flight.get("origin") and flight.get("destination"))
+                ])
+                for flight in candidates:
                     existing_origin = flight.get("origin", "")
                     existing_destination = flight.get("destination", "")
                     
-                    # If no route data, try to look it up
+                    # If no route data, use the batch lookup result
                     if not existing_origin or not existing_destination:
                         callsign = flight.get("callsign", "")
                         if callsign:
-                            origin, destination, origin_city, dest_city, origin_country, dest_country = self.lookup_flight_route(callsign)
+                            route = routes[callsign]
+                            if isinstance(route, Future):
+                                route = route.result()
+                            origin, destination, origin_city, dest_city, origin_country, dest_country = route
                             if origin:
                                 flight["origin"] = origin
                                 existing_origin = origin
@@ -1464,7 +2171,9 @@ if shm_path.exists():
                     
                     # Check if route is valid (both set and different)
                     if existing_origin and existing_destination and existing_origin != existing_destination:
-                        # Get city/country if not already set
+                        # Get city/country if not already set (both ends at once if both are missing)
+                        if not flight.get("origin_city") and not flight.get("destination_city"):
+                            self._get_airport_details_pair(existing_origin, existing_destination)
                         if not flight.get("origin_city"):
                             origin_city, origin_country = self._get_airport_details(existing_origin)
                             if origin_city:
@@ -1481,7 +2190,7 @@ if shm_path.exists():
                         return [flight]  # Return first flight with valid route
                 
                 # No flight with valid route found, return closest anyway
-                return [flights[0]]
+                return [candidates[0]]
             
             return []
             
@@ -1511,25 +2220,32 @@ if shm_path.exists():
         
         self.last_request_time = time.time()
         
+        # Flight API is failing repeatedly: fail fast until the breaker lets a probe through
+        if not self._flights_breaker.allow():
+            self.consecutive_failures += 1
+            return None
+        
         # Use the configured API provider
         if self.api_provider == "rapidapi":
             flights = self.fetch_flights_rapidapi()
         else:
             # Fallback to ADSB Exchange
-            # Use the configured API provider
-            if self.api_provider == "rapidapi":
-                flights = self.fetch_flights_rapidapi()
-            else:
-                # Fallback to ADSB Exchange
-                flights = self.fetch_flights_adsbexchange()
+            flights = self.fetch_flights_adsbexchange()
         
         if flights is not None:
             self.consecutive_failures = 0
+            self._flights_breaker.record_success()
         else:
             self.consecutive_failures += 1
+            self._record_breaker_failure(self._flights_breaker)
         
         return flights
     
+    def _record_breaker_failure(self, breaker: _CircuitBreaker):
+        """Count an API failure on a circuit breaker, logging when it opens."""
+        if breaker.record_failure():
+            self._log_error_once(f"{breaker.name}: too many failures, pausing calls for {breaker.reset_timeout:.0f}s")
+    
     def _log_error_once(self, message: str):
         """
         Log an error message, but only once per error_cooldown period.
@@ -1550,14 +2266,13 @@ if shm_path.exists():
         Args:
             force: Force update even if cache is fresh.
         """
-        current_time = time.time()
-        
-        # If we have consecutive failures, increase the update interval to avoid hammering the API
-        effective_interval = self.update_interval
-        if self.consecutive_failures > 3:
-            effective_interval = self.update_interval * 2  # Double the interval after 3 failures
+        self._maybe_flush_route_db()
+        # Update timing is monotonic so NTP clock steps can't stall or rush fetches
+        current_time = self._now = time.monotonic()
+        self._wall_now = time.time()
         
-        if force or (current_time - self.last_update) >= effective_interval:
+        # Repeated API failures are backed off by the circuit breaker in fetch_flights()
+        if force or (current_time - self.last_update) >= self.update_interval:
             # Mark that we're attempting a fetch (set this early so display updates)
             if not self.has_attempted_fetch:
                 self.has_attempted_fetch = True
@@ -1578,9 +2293,11 @@ if shm_path.exists():
                     # Only update last_seen_flight if this flight has valid route data
                     if origin and destination:
                         self.current_flight_index = 0
-                        # Store the first flight as last seen (only if it has route data)
-                        self.last_seen_flight = flight.copy()
-                        self.last_seen_flight["seen_at"] = current_time
+                        # Store the first flight as last seen (only if it has route data),
+                        # completed before it is published to the display thread
+                        last_seen_flight = flight.copy()
+                        last_seen_flight["seen_at"] = current_time
+                        self.last_seen_flight = last_seen_flight
                         self.last_seen_time = current_time
                 # If flights is empty list, keep the existing last_seen_flight
                 # This way we always have something to display
@@ -1590,6 +2307,40 @@ if shm_path.exists():
                 self._sync_routes_to_main_db()
                 self.last_route_sync = current_time
     
+    # Icon pulse timing (seconds), shared by the loading icon and the route icon
+    PULSE_FADE_DOWN_TIME = 0.5  # Time to fade from max to min
+    PULSE_GAP_TIME = 1.0        # Pause at minimum brightness
+    PULSE_FADE_UP_TIME = 0.5    # Time to fade from min to max
+    # One pulse cycle sampled into a table (see _build_pulse_table)
+    _PULSE_CYCLE = PULSE_FADE_DOWN_TIME + PULSE_GAP_TIME + PULSE_FADE_UP_TIME
+    _PULSE_LUT_SIZE = 1024
+    _PULSE_LUT = _build_pulse_table(PULSE_FADE_DOWN_TIME, PULSE_GAP_TIME, PULSE_FADE_UP_TIME, _PULSE_LUT_SIZE)
+    _PULSE_LUT_SCALE = _PULSE_LUT_SIZE / _PULSE_CYCLE
+    
+    def _pulse_brightness(self, now: float, min_brightness: float = 0.3, max_brightness: float = 1.0) -> float:
+        """
+        Get the icon pulse brightness at a point in time.
+        
+        Args:
+            now: Frame timestamp in seconds
+            min_brightness: Brightness during the pause at the bottom of the pulse
+            max_brightness: Brightness at the top of the pulse
+        
+        Returns:
+            Brightness between min_brightness and max_brightness.
+        """
+        level = self._PULSE_LUT[int((now % self._PULSE_CYCLE) * self._PULSE_LUT_SCALE)]
+        return min_brightness + (max_brightness - min_brightness) * level
+    
+    # Simple plane icon (7x5 pixels): (dx, dy) offsets of its lit pixels
+    _PLANE_OFFSETS = (
+        (2, 0), (3, 0),                                          # Top wing
+        (1, 1), (2, 1), (3, 1), (4, 1), (5, 1),                  # Body
+        (0, 2), (1, 2), (2, 2), (3, 2), (4, 2), (5, 2), (6, 2),  # Middle
+        (2, 3), (3, 3),                                          # Bottom wing
+        (1, 4), (2, 4),                                          # Tail
+    )
+    
     def draw_plane_icon(self, canvas, x: int, y: int, visible: bool = True):
         """
         Draw a simple plane icon at the given position.
@@ -1603,53 +2354,179 @@ if shm_path.exists():
         if not visible:
             return
         
-        # Simple plane icon (8x8 pixels)
-        # Using SetPixel to draw the plane shape
-        plane_pixels = [
-            # Top wing
-            (x + 2, y),
-            (x + 3, y),
-            # Body
-            (x + 1, y + 1),
-            (x + 2, y + 1),
-            (x + 3, y + 1),
-            (x + 4, y + 1),
-            (x + 5, y + 1),
-            # Middle
-            (x, y + 2),
-            (x + 1, y + 2),
-            (x + 2, y + 2),
-            (x + 3, y + 2),
-            (x + 4, y + 2),
-            (x + 5, y + 2),
-            (x + 6, y + 2),
-            # Bottom wing
-            (x + 2, y + 3),
-            (x + 3, y + 3),
-            # Tail
-            (x + 1, y + 4),
-            (x + 2, y + 4),
-        ]
+        # One blit of the prebuilt icon (the canvas clips pixels outside it).
+        # Pixels around the plane inside its 7x5 box are drawn black, same as the cleared background.
+        canvas.SetImage(self._get_plane_image(), x, y)
+    
+    def _get_plane_image(self) -> Image.Image:
+        """Get the plane icon as a 7x5 RGB image in self.color, rebuilt only if the color changes."""
+        rgb = (self.color.red, self.color.green, self.color.blue)
+        cached = self._plane_image
+        if cached is not None and cached[0] == rgb:
+            return cached[1]
+        image = Image.new("RGB", (7, 5))
+        for offset in self._PLANE_OFFSETS:
+            image.putpixel(offset, rgb)
+        self._plane_image = (rgb, image)
+        return image
+    
+    def _pick_display_flight(self, flights: List[Dict], last_seen_flight: Optional[Dict]) -> Optional[Dict]:
+        """
+        Choose the flight shown on screen. Decided once per flights/last_seen_flight
+        update (both are replaced, never modified) and reused every frame.
+        
+        Args:
+            flights: Current flights, closest first
+            last_seen_flight: Last flight that was seen, if any
+        
+        Returns:
+            Flight to display, or None if there is nothing to show.
+        """
+        cached = self._display_pick
+        if cached is not None and cached[0] is flights and cached[1] is last_seen_flight:
+            return cached[2]
+        
+        # Get the closest flight (only one flight now)
+        # But first check if it has valid route data, otherwise use last_seen_flight
+        flight = None
+        if flights:
+            current_flight = flights[0]
+            # Only use current flight if it has valid route data
+            if current_flight.get("origin") and current_flight.get("destination"):
+                flight = current_flight
+        
+        # If current flight doesn't have valid route data, use last_seen_flight instead
+        # (even without route data: this prevents a blank display)
+        if not flight and last_seen_flight:
+            flight = last_seen_flight
+        
+        self._display_pick = (flights, last_seen_flight, flight)
+        return flight
+    
+    def _get_flight_texts(self, flight: dict, canvas_width: int) -> tuple:
+        """
+        Get the strings display() draws for a flight and their horizontal positions.
+        Composed once per flight dict (flights are replaced, never modified, on update).
+        
+        Args:
+            flight: Flight shown on screen
+            canvas_width: Canvas width in pixels
+        
+        Returns:
+            Tuple of (callsign, origin, destination, number_x, orig_code, dest_code,
+            orig_x, icon_x, dest_x, city_country_text, city_width). Without a route,
+            orig_x is where "UFO" is drawn; city_country_text is "" without cities.
+        """
+        cached = self._flight_texts
+        if cached is not None and cached[0] is flight and cached[1] == canvas_width:
+            return cached[2]
+        
+        callsign = flight.get("callsign", "UNKNOWN")
+        origin = flight.get("origin", "")
+        destination = flight.get("destination", "")
+        
+        # Truncate flight number if too long for display, then center it
+        if len(callsign) > 10:
+            callsign = callsign[:10]
+        number_width = len(callsign) * self._styles_resolved["number"]["char_width"]
+        number_x = max(0, (canvas_width - number_width) // 2)
+        
+        # Route font character width (7 for the default medium 7x13 font)
+        route_char_width = self._styles_resolved["route"]["char_width"]
+        orig_code = dest_code = ""
+        icon_x = dest_x = 0
+        if origin or destination:
+            # Get airport codes (first 3 characters)
+            orig_code = origin[:3] if origin and len(origin) >= 3 else origin
+            dest_code = destination[:3] if destination and len(destination) >= 3 else destination
+            
+            spacing = 2  # Space on each side of icon
+            
+            # Calculate widths
+            orig_width = len(orig_code) * route_char_width if orig_code else 0
+            dest_width = len(dest_code) * route_char_width if dest_code else 0
+            icon_width = 12 if self.aircraft_icon else 10  # "->" fallback
+            
+            # Total width: origin + space + icon + space + destination
+            total_width = orig_width + spacing + icon_width + spacing + dest_width
+            
+            # Center the route horizontally, with proper spacing around the icon
+            orig_x = max(0, (canvas_width - total_width) // 2)
+            icon_x = orig_x + orig_width + spacing
+            dest_x = icon_x + icon_width + spacing
+        else:
+            # No route data available - "UFO" centered horizontally
+            orig_x = max(0, (canvas_width - 3 * route_char_width) // 2)
+        
+        # City to city line: "Dubai (UAE) to Mumbai (India)" or "Dubai to London"
+        city_country_text = ""
+        city_width = 0
+        origin_city = flight.get("origin_city", "")
+        destination_city = flight.get("destination_city", "")
+        if origin_city and destination_city:
+            origin_country_name = self.COUNTRY_CODE_TO_NAME.get(flight.get("origin_country", ""), "")
+            dest_country_name = self.COUNTRY_CODE_TO_NAME.get(flight.get("destination_country", ""), "")
+            
+            origin_display = f"{origin_city} ({origin_country_name})" if origin_country_name else origin_city
+            dest_display = f"{destination_city} ({dest_country_name})" if dest_country_name else destination_city
+            
+            city_country_text = f"{origin_display} to {dest_display}"
+            city_width = len(city_country_text) * self._styles_resolved["route_city"]["char_width"]
         
-        for px, py in plane_pixels:
-            if 0 <= px < canvas.width and 0 <= py < canvas.height:
-                canvas.SetPixel(px, py, self.color.red, self.color.green, self.color.blue)
+        texts = (callsign, origin, destination, number_x, orig_code, dest_code,
+                 orig_x, icon_x, dest_x, city_country_text, city_width)
+        self._flight_texts = (flight, canvas_width, texts)
+        return texts
     
-    def display(self):
-        """Display flight information with animated plane icon."""
+    def _begin_frame(self, canvas, frame_key: tuple) -> bool:
+        """
+        Start drawing a frame: clear the canvas, unless the frame would look like the one on screen.
+        
+        Args:
+            canvas: Canvas the frame is drawn on
+            frame_key: Everything that determines what the frame looks like
+        
+        Returns:
+            False if frame_key matches the frame on screen (skip drawing and swapping).
+        """
+        if frame_key == self._frame_key:
+            return False
+        self._frame_key = frame_key
+        
+        # Frames alternate between two canvases (double buffering); each remembers which rows
+        # it was last drawn into, and only those are cleared. A canvas not drawn on yet is
+        # cleared completely.
+        rows = self._frame_rows[frame_key[0]]
+        canvas_id = id(canvas)
+        dirty_start, dirty_end = self._dirty_rows.get(canvas_id, (0, canvas.height))
+        self._dirty_rows[canvas_id] = rows
+        
+        # Clear by filling with black (prevents leftover pixels)
+        black = self._black
+        last_x = canvas.width - 1
+        for y in range(dirty_start, dirty_end):
+            graphics.DrawLine(canvas, 0, y, last_x, y, black)
+        return True
+    
+    def display(self, now: Optional[float] = None):
+        """
+        Display flight information with animated plane icon.
+        
+        Args:
+            now: time.monotonic() timestamp of this frame, shared by all animation math
+                 (read here if not given).
+        """
         # Use existing canvas for double buffering (reuse, don't create new each frame)
         new_canvas = self.canvas
+        # Flight data is replaced by the background fetch thread; use one consistent snapshot
+        flights = self.flights
+        last_seen_flight = self.last_seen_flight
         
-        # Clear canvas completely by filling with black (prevents leftover pixels)
-        black = graphics.Color(0, 0, 0)
-        for y in range(new_canvas.height):
-            graphics.DrawLine(new_canvas, 0, y, new_canvas.width - 1, y, black)
-        
-        # Update animation state
-        current_time = time.time()
+        # Update animation state (one clock read per frame)
+        current_time = time.monotonic() if now is None else now
         animation_speed = self.animation_speed
         
-        if not self.flights:
+        if not flights:
             # Use slower animation for last seen flights
             animation_speed = self.animation_speed * 2
         
@@ -1658,19 +2535,23 @@ if shm_path.exists():
             self.last_animation_toggle = current_time
         
         # Always ensure something is displayed
-        if not self.flights:
+        if not flights:
             # Priority 1: Show last seen flight if available (always show this if we have it)
-            if self.last_seen_flight and self.last_seen_flight.get("callsign"):
+            if last_seen_flight and last_seen_flight.get("callsign"):
                 # Display last seen flight
-                callsign = self.last_seen_flight.get("callsign", "UNKNOWN")
-                
-                # Draw plane icon (blinking)
-                self.draw_plane_icon(new_canvas, 2, 2, self.animation_state)
+                callsign = last_seen_flight.get("callsign", "UNKNOWN")
                 
                 # Truncate if too long for display
                 if len(callsign) > 8:
                     callsign = callsign[:8]
                 
+                # Only the blinking icon changes while the same flight is shown
+                if not self._begin_frame(new_canvas, ("last", callsign, self.animation_state)):
+                    return
+                
+                # Draw plane icon (blinking)
+                self.draw_plane_icon(new_canvas, 2, 2, self.animation_state)
+                
                 # Position text to the right of the icon
                 graphics.DrawText(new_canvas, self.main_font, 12, 12, self.color, callsign)
                 
@@ -1681,13 +2562,15 @@ if shm_path.exists():
                 if self.consecutive_failures > 0:
                     # Show API error message (we've tried and failed)
                     msg = "API error"
-                    graphics.DrawText(new_canvas, self.small_font, 2, 16, self.color, msg)
+                    x_pos = 2
                 else:
                     # We've attempted fetch and got empty result (no flights in area)
                     msg = "No flights"
                     # Center the message
                     x_pos = max(2, (new_canvas.width - len(msg) * 5) // 2)
-                    graphics.DrawText(new_canvas, self.small_font, x_pos, 16, self.color, msg)
+                if not self._begin_frame(new_canvas, ("status", msg)):
+                    return
+                graphics.DrawText(new_canvas, self.small_font, x_pos, 16, self.color, msg)
             else:
                 # Show pulsing aircraft icon instead of "Loading..." text
                 if self.aircraft_icon:
@@ -1696,267 +2579,51 @@ if shm_path.exists():
                     icon_x = (new_canvas.width - icon_size) // 2
                     icon_y = (new_canvas.height - icon_size) // 2
                     
-                    # Pulse animation (similar to route icon pulse)
-                    fade_down_time = 0.5    # Time to fade from max to min
-                    gap_time = 1.0          # Pause at minimum brightness
-                    fade_up_time = 0.5      # Time to fade from min to max
-                    total_cycle = fade_down_time + gap_time + fade_up_time
-                    
-                    # Brightness range
-                    min_brightness = 0.3    # 30%
-                    max_brightness = 1.0    # 100%
-                    
-                    # Calculate position in animation cycle
-                    cycle_position = current_time % total_cycle
-                    
-                    if cycle_position < fade_down_time:
-                        # Fading down (100% -> 30%)
-                        progress = cycle_position / fade_down_time
-                        pulse_brightness = max_brightness - (max_brightness - min_brightness) * progress
-                    elif cycle_position < fade_down_time + gap_time:
-                        # Gap at minimum brightness
-                        pulse_brightness = min_brightness
-                    else:
-                        # Fading up (30% -> 100%)
-                        progress = (cycle_position - fade_down_time - gap_time) / fade_up_time
-                        pulse_brightness = min_brightness + (max_brightness - min_brightness) * progress
+                    # Pulse animation (same as the route icon pulse, down to 30%)
+                    icon_level = self._icon_level(self._pulse_brightness(current_time))
+                    if not self._begin_frame(new_canvas, ("loading", icon_level)):
+                        return
                     
                     # Draw pulsing aircraft icon
-                    self._draw_aircraft_icon(new_canvas, icon_x, icon_y, self.icon_color_rgb, 
-                                            brightness=pulse_brightness, 
-                                            visible=True)
+                    self._blit_aircraft_icon(new_canvas, icon_x, icon_y, self.icon_color_rgb, icon_level)
                 else:
                     # Fallback to text if icon not available
                     msg = "Loading..."
                     x_pos = max(2, (new_canvas.width - len(msg) * 5) // 2)
+                    if not self._begin_frame(new_canvas, ("loading", msg)):
+                        return
                     graphics.DrawText(new_canvas, self.small_font, x_pos, 16, self.color, msg)
         else:
-            # Get the closest flight (only one flight now)
-            # But first check if it has valid route data, otherwise use last_seen_flight
-            flight = None
-            if self.flights:
-                current_flight = self.flights[0]
-                origin = current_flight.get("origin", "")
-                destination = current_flight.get("destination", "")
-                # Only use current flight if it has valid route data
-                if origin and destination:
-                    flight = current_flight
-            
-            # If current flight doesn't have valid route data, use last_seen_flight instead
-            if not flight and self.last_seen_flight:
-                last_origin = self.last_seen_flight.get("origin", "")
-                last_destination = self.last_seen_flight.get("destination", "")
-                # Only use last_seen_flight if it has valid route data
-                if last_origin and last_destination:
-                    flight = self.last_seen_flight
-            
-            # If we still don't have a valid flight with route data, use last_seen_flight anyway
-            # This prevents blank display - show the last flight even if it doesn't have route data
-            if not flight and self.last_seen_flight:
-                flight = self.last_seen_flight
+            # Closest flight, or last_seen_flight if it lacks route data (picked once per update)
+            flight = self._pick_display_flight(flights, last_seen_flight)
             
             # If we truly have nothing, return early (shouldn't happen often)
             if not flight:
                 return
             
-            callsign = flight.get("callsign", "UNKNOWN")
-            origin = flight.get("origin", "")
-            destination = flight.get("destination", "")
-            
+            # Strings and horizontal positions only change with the flight, so they're
+            # composed once per flight (see _get_flight_texts) and reused every frame
+            texts = self._get_flight_texts(flight, new_canvas.width)
+            (callsign, origin, destination, number_x, orig_code, dest_code,
+             orig_x, icon_x, dest_x, city_country_text, city_width) = texts
             
-            # Calculate vertical positions for centered layout
-            # Layout: Flight number (top), Route (middle), City to Country (bottom)
-            # Canvas height is 32 pixels
-            # Get actual font heights from the fonts being used
-            icon_size = 12
-            number_font_height = self._get_font_height(self.number_font_size)  # Dynamic based on style
-            route_font_height = self._get_font_height(self.route_font_size)  # Dynamic based on style
-            city_font_height = self._get_font_height(self.route_city_font_size)  # Dynamic based on style
-            gap1 = 0  # Gap between flight number and route
-            gap2 = 1  # Gap between route and city/country line
+            # Aircraft icon between origin and destination pulses (fully off during the gap)
+            draw_route_icon = bool(self.aircraft_icon and orig_code and dest_code)
+            icon_level = self._icon_level(self._pulse_brightness(current_time, min_brightness=0.0)) if draw_route_icon else 0
             
-            # Total content height: number + gap1 + route + gap2 + city
-            total_content_height = number_font_height + gap1 + route_font_height + gap2 + city_font_height
-            
-            # Calculate the visual center of the canvas
-            canvas_center_y = new_canvas.height / 2.0  # 16.0 for 32px canvas
-            
-            # Calculate the visual center of our content block
-            # Move up by 2 pixels to balance spacing (4 grids top, 2 grids bottom -> 3 grids each)
-            top_margin = canvas_center_y - (total_content_height / 2.0) - 1
-            
-            # Flight number baseline (TOP LINE)
-            number_y = int(top_margin + number_font_height)
-            
-            # Route text baseline (MIDDLE LINE)
-            route_y = int(top_margin + number_font_height + gap1 + route_font_height)
-            
-            # City/Country text baseline (BOTTOM LINE)
-            city_y = int(top_margin + number_font_height + gap1 + route_font_height + gap2 + city_font_height)
-            
-            # Icon should be vertically centered with the route text
-            # For 7x13 font, the visual center is about 6-7 pixels above baseline
-            # Position icon so its center aligns with text visual center
-            text_visual_center = route_y - 6  # Approximate visual center of text
-            icon_y = text_visual_center - icon_size // 2 + 1  # Center icon, then move 1 pixel down
-            
-            # Display flight number on TOP LINE - HORIZONTALLY CENTERED
-            # Truncate if too long for display
-            if len(callsign) > 10:
-                callsign = callsign[:10]
-            
-            # Flight number character width (dynamic based on font size)
-            number_char_width = self._get_font_char_width(self.number_font_size)
-            number_width = len(callsign) * number_char_width
-            number_x = max(0, (new_canvas.width - number_width) // 2)
-            
-            # Apply brightness from styles.json to flight number color
-            r, g, b = self.number_color_rgb
-            dimmed_r = int(r * self.number_brightness)
-            dimmed_g = int(g * self.number_brightness)
-            dimmed_b = int(b * self.number_brightness)
-            dimmed_number_color = graphics.Color(dimmed_r, dimmed_g, dimmed_b)
-            
-            graphics.DrawText(new_canvas, self.number_font, number_x, number_y, dimmed_number_color, callsign)
-            
-            # Display route on BOTTOM LINE with aircraft icon - CENTERED
-            if origin or destination:
-                # Get airport codes (first 3 characters)
-                orig_code = origin[:3] if origin and len(origin) >= 3 else origin
-                dest_code = destination[:3] if destination and len(destination) >= 3 else destination
-                
-                # Route uses MEDIUM font (7x13) = 7 pixels wide per character
-                route_char_width = 7
-                spacing = 2  # Space on each side of icon
-                
-                # Calculate widths
-                orig_width = len(orig_code) * route_char_width if orig_code else 0
-                dest_width = len(dest_code) * route_char_width if dest_code else 0
-                icon_width = icon_size if self.aircraft_icon else 10  # "->" fallback
-                
-                # Total width: origin + space + icon + space + destination
-                total_width = orig_width + spacing + icon_width + spacing + dest_width
-                
-                # Center the route horizontally
-                start_x = max(0, (new_canvas.width - total_width) // 2)
-                
-                # Calculate exact positions with proper spacing
-                orig_x = start_x
-                icon_x = orig_x + orig_width + spacing
-                dest_x = icon_x + icon_width + spacing
-                
-                # Draw origin code with brightness from styles.json
-                if orig_code:
-                    r, g, b = self.route_color_rgb
-                    dimmed_r = int(r * self.route_brightness)
-                    dimmed_g = int(g * self.route_brightness)
-                    dimmed_b = int(b * self.route_brightness)
-                    dimmed_route_color = graphics.Color(dimmed_r, dimmed_g, dimmed_b)
-                    graphics.DrawText(new_canvas, self.route_font, orig_x, route_y, dimmed_route_color, orig_code)
-                
-                # Draw aircraft icon between origin and destination (with pulse + gap)
-                if self.aircraft_icon and orig_code and dest_code:
-                    # Animation timing (in seconds)
-                    fade_down_time = 0.5    # Time to fade from max to min
-                    gap_time = 1.0          # Pause at minimum brightness
-                    fade_up_time = 0.5      # Time to fade from min to max
-                    total_cycle = fade_down_time + gap_time + fade_up_time
-                    
-                    # Brightness range
-                    min_brightness = 0   # 30%
-                    max_brightness = 1.0    # 100%
-                    
-                    # Calculate position in animation cycle
-                    cycle_position = current_time % total_cycle
-                    
-                    if cycle_position < fade_down_time:
-                        # Fading down (100% -> 30%)
-                        progress = cycle_position / fade_down_time
-                        pulse_brightness = max_brightness - (max_brightness - min_brightness) * progress
-                    elif cycle_position < fade_down_time + gap_time:
-                        # Gap at minimum brightness
-                        pulse_brightness = min_brightness
-                    else:
-                        # Fading up (30% -> 100%)
-                        progress = (cycle_position - fade_down_time - gap_time) / fade_up_time
-                        pulse_brightness = min_brightness + (max_brightness - min_brightness) * progress
-                    
-                    # icon_y is pre-calculated to be vertically centered with text
-                    self._draw_aircraft_icon(new_canvas, icon_x, icon_y, self.icon_color_rgb, 
-                                            brightness=pulse_brightness, 
-                                            visible=True)
-                elif orig_code and dest_code:
-                    # Fallback: draw simple arrow if icon not available (with brightness)
-                    r, g, b = self.route_color_rgb
-                    dimmed_r = int(r * self.route_brightness)
-                    dimmed_g = int(g * self.route_brightness)
-                    dimmed_b = int(b * self.route_brightness)
-                    dimmed_route_color = graphics.Color(dimmed_r, dimmed_g, dimmed_b)
-                    graphics.DrawText(new_canvas, self.route_font, icon_x, route_y, dimmed_route_color, "->")
-                
-                # Draw destination code with brightness from styles.json
-                if dest_code:
-                    r, g, b = self.route_color_rgb
-                    dimmed_r = int(r * self.route_brightness)
-                    dimmed_g = int(g * self.route_brightness)
-                    dimmed_b = int(b * self.route_brightness)
-                    dimmed_route_color = graphics.Color(dimmed_r, dimmed_g, dimmed_b)
-                    graphics.DrawText(new_canvas, self.route_font, dest_x, route_y, dimmed_route_color, dest_code)
-            else:
-                # No route data available - show just "UFO" text (no icon)
-                ufo_text = "UFO"
-                route_char_width = 7  # Medium font width
-                ufo_width = len(ufo_text) * route_char_width
-                
-                # Center horizontally
-                ufo_x = max(0, (new_canvas.width - ufo_width) // 2)
-                
-                # Draw "UFO" text with brightness from styles.json
-                r, g, b = self.route_color_rgb
-                dimmed_r = int(r * self.route_brightness)
-                dimmed_g = int(g * self.route_brightness)
-                dimmed_b = int(b * self.route_brightness)
-                dimmed_route_color = graphics.Color(dimmed_r, dimmed_g, dimmed_b)
-                graphics.DrawText(new_canvas, self.route_font, ufo_x, route_y, dimmed_route_color, ufo_text)
-            
-            # Display city to city on THIRD LINE (if available) - SCROLLING MARQUEE
-            origin_city = flight.get("origin_city", "")
-            destination_city = flight.get("destination_city", "")
-            origin_country_code = flight.get("origin_country", "")
-            destination_country_code = flight.get("destination_country", "")
-            
-            if origin_city and destination_city:
-                # Format: "Dubai (UAE) to Mumbai (India)" or "Dubai to London"
-                origin_country_name = self.COUNTRY_CODE_TO_NAME.get(origin_country_code, "")
-                dest_country_name = self.COUNTRY_CODE_TO_NAME.get(destination_country_code, "")
-                
-                origin_display = f"{origin_city} ({origin_country_name})" if origin_country_name else origin_city
-                dest_display = f"{destination_city} ({dest_country_name})" if dest_country_name else destination_city
-                
-                city_country_text = f"{origin_display} to {dest_display}"
-                
-                # Reset scroll position if text changed
+            # City to city on THIRD LINE (if available) - SCROLLING MARQUEE
+            # city_x stays None when there is nothing to draw (no cities, or text fully off-screen)
+            city_x = None
+            if city_country_text:
+                # Restart scrolling if text changed
                 if city_country_text != self.city_country_text_cache:
-                    self.city_country_scroll_position = 0
                     self.city_country_text_cache = city_country_text
-                    self.last_scroll_time = time.time()
+                    self._scroll_start_time = current_time
                 
-                # Use route city font and style from styles.json
-                city_font = self.route_city_font
-                city_char_width = self._get_font_char_width(self.route_city_font_size)
-                city_width = len(city_country_text) * city_char_width
                 canvas_width = new_canvas.width
                 
                 # Only scroll if text is wider than the canvas
                 if city_width > canvas_width:
-                    # Update scroll position based on time
-                    current_time = time.time()
-                    scroll_delta = current_time - self.last_scroll_time
-                    self.last_scroll_time = current_time
-                    
-                    # Move scroll position (pixels per second)
-                    self.city_country_scroll_position += self.city_country_scroll_speed * scroll_delta
-                    
                     # Calculate when text is completely off-screen to the left
                     # Text starts at canvas_width (right edge) when position = 0
                     # Text is fully off left when position = canvas_width + city_width
@@ -1965,33 +2632,61 @@ if shm_path.exists():
                     # Total cycle: text scrolling + gap
                     total_cycle = text_off_screen_position + self.city_country_gap_size
                     
-                    # Reset scroll position when it completes a full cycle
-                    if self.city_country_scroll_position >= total_cycle:
-                        self.city_country_scroll_position = 0
+                    # Scroll position (pixels) is a function of time since the text changed,
+                    # wrapping around after each full cycle
+                    scroll_position = ((current_time - self._scroll_start_time) * self.city_country_scroll_speed) % total_cycle
                     
                     # Calculate x position
                     # Position 0: text starts at right edge (x = canvas_width)
                     # Position text_off_screen_position: text fully off left (x = -city_width)
                     # Position total_cycle: gap complete, ready to restart
-                    if self.city_country_scroll_position <= text_off_screen_position:
-                        # Text is visible or scrolling
-                        city_x = int(canvas_width - self.city_country_scroll_position)
-                    else:
-                        # In gap period - don't draw text (it's off-screen)
-                        city_x = -1000  # Way off screen
+                    x = int(canvas_width - scroll_position)
+                    if -city_width < x < canvas_width:
+                        # Text is (partly) visible
+                        city_x = x
+                    # Otherwise it's entering at the right edge, has just left, or is in the
+                    # gap period: DrawText would only walk glyphs that are all clipped
                 else:
                     # Text fits, center it
                     city_x = max(0, (canvas_width - city_width) // 2)
-                    # Reset scroll position when text fits
-                    self.city_country_scroll_position = 0
+            
+            # Same flight, icon brightness and marquee offset: the frame on screen is still current
+            if not self._begin_frame(new_canvas, ("flight", texts, icon_level, city_x)):
+                return
+            
+            # Vertical layout (flight number, route, cities) is computed once in __init__
+            number_style = self._styles_resolved["number"]
+            route_style = self._styles_resolved["route"]
+            city_style = self._styles_resolved["route_city"]
+            number_y, route_y, city_y, icon_y = self._flight_layout
+            
+            # Display flight number on TOP LINE - HORIZONTALLY CENTERED
+            # Flight number color has the brightness from styles.json applied already
+            graphics.DrawText(new_canvas, number_style["font"], number_x, number_y, number_style["color"], callsign)
+            
+            # Display route on BOTTOM LINE with aircraft icon - CENTERED
+            if origin or destination:
+                # Draw origin code with brightness from styles.json
+                if orig_code:
+                    graphics.DrawText(new_canvas, route_style["font"], orig_x, route_y, route_style["color"], orig_code)
                 
-                # Use route city color and brightness from styles.json (separate from route codes)
-                r, g, b = self.route_city_color_rgb
-                dimmed_r = int(r * self.route_city_brightness)
-                dimmed_g = int(g * self.route_city_brightness)
-                dimmed_b = int(b * self.route_city_brightness)
-                dimmed_route_city_color = graphics.Color(dimmed_r, dimmed_g, dimmed_b)
-                graphics.DrawText(new_canvas, city_font, city_x, city_y, dimmed_route_city_color, city_country_text)
+                if draw_route_icon:
+                    # icon_y is pre-calculated to be vertically centered with text
+                    self._blit_aircraft_icon(new_canvas, icon_x, icon_y, self.icon_color_rgb, icon_level)
+                elif orig_code and dest_code:
+                    # Fallback: draw simple arrow if icon not available (with brightness)
+                    graphics.DrawText(new_canvas, route_style["font"], icon_x, route_y, route_style["color"], "->")
+                
+                # Draw destination code with brightness from styles.json
+                if dest_code:
+                    graphics.DrawText(new_canvas, route_style["font"], dest_x, route_y, route_style["color"], dest_code)
+            else:
+                # No route data available - show just "UFO" text (no icon), centered at orig_x
+                graphics.DrawText(new_canvas, route_style["font"], orig_x, route_y, route_style["color"], "UFO")
+            
+            if city_x is not None:
+                # Use route city font, color and brightness from styles.json (separate from route codes)
+                graphics.DrawText(new_canvas, city_style["font"], city_x, city_y, city_style["color"], city_country_text)
             
             # Debug: Print what fields are available (only once per unique flight)
             if (not origin and not destination) and callsign not in getattr(self, '_debugged_flights', set()):
@@ -2006,6 +2701,9 @@ if shm_path.exists():
         # Swap the new canvas to display (double buffering prevents flicker)
         self.canvas = self.matrix.SwapOnVSync(new_canvas)
     
+    # How often the fetch thread checks whether an update is due (update_flights() enforces the interval)
+    FETCH_LOOP_INTERVAL = 0.5
+    
     def run(self, display_interval: float = 0.1):
         """
         Run the flight tracker display continuously.
@@ -2013,23 +2711,41 @@ if shm_path.exists():
         Args:
             display_interval: How often to refresh the display in seconds.
         """
+        # Flight data is fetched on its own thread so network waits never stall the animation
+        fetcher = threading.Thread(target=self._fetch_loop, name="flight-fetch", daemon=True)
         try:
             # Show initial display immediately (will show last seen flight if available)
             self.display()
-            
-            # Initial fetch - do it synchronously but update display after
-            self.update_flights(force=True)
-            self.display()  # Update display after initial fetch
+            fetcher.start()
             
             while True:
-                self.update_flights()
-                self.display()
+                self.display(time.monotonic())
                 time.sleep(display_interval)
         except KeyboardInterrupt:
             self.clear()
+        finally:
+            self._stop_fetching.set()
+            # Don't leave routes found since the last periodic flush to atexit
+            self._flush_route_db()
+    
+    def _fetch_loop(self):
+        """Keep flight data up to date until run() stops (runs on the background fetch thread)."""
+        # The first fetch is forced; an error in any pass, including the first,
+        # is logged and retried instead of ending the thread
+        force = True
+        while True:
+            try:
+                self.update_flights(force=force)
+            except Exception as e:
+                self._log_error_once(f"Flight update error: {e}")
+            force = False
+            if self._stop_fetching.wait(self.FETCH_LOOP_INTERVAL):
+                break
     
     def clear(self):
         """Clear the display."""
+        self._frame_key = None
+        self._dirty_rows.clear()
         self.canvas.Clear()
         self.canvas = self.matrix.SwapOnVSync(self.canvas)
 
@@ -7,6 +7,7 @@ Supports common image formats (PNG, JPEG, GIF, etc.).
 import time
 import sys
 from pathlib import Path
+from typing import List, Optional
 from PIL import Image
 
 from rgbmatrix import RGBMatrix
@@ -17,6 +18,39 @@ from utils import (
     get_project_root,
 )
 
+# Resize filters selectable with image_display.resample in settings.json.
+# At LED matrix sizes (<= 128 pixels wide) LANCZOS looks no better than BILINEAR
+# but costs several times more per output pixel.
+_RESAMPLE_FILTERS = {
+    "nearest": Image.Resampling.NEAREST,
+    "bilinear": Image.Resampling.BILINEAR,
+    "bicubic": Image.Resampling.BICUBIC,
+    "lanczos": Image.Resampling.LANCZOS,
+}
+
+
+
+def _build_gamma_lut(gamma) -> Optional[List[int]]:
+    """
+    Build an Image.point() lookup table applying gamma correction to all three channels.
+    
+    Args:
+        gamma: Gamma exponent (> 1 darkens midtones, which LED matrices usually need).
+    
+    Returns:
+        768-entry table (256 per RGB channel), or None when gamma is 1.0 or invalid.
+    """
+    try:
+        exponent = float(gamma)
+    except (TypeError, ValueError):
+        exponent = 0.0
+    if exponent <= 0:
+        print(f"Warning: Invalid image_display.gamma '{gamma}', gamma correction disabled")
+        return None
+    if exponent == 1.0:
+        return None
+    return [round(255 * (i / 255) ** exponent) for i in range(256)] * 3
+
 
 class ImageDisplay:
     """Displays an image file on the LED matrix."""
@@ -36,6 +70,20 @@ class ImageDisplay:
         matrix_config = self.config.get("matrix", {})
         self.width = matrix_config.get("cols", 64)
         self.height = matrix_config.get("rows", 32)
+        
+        # Resize filter (bilinear by default, see _RESAMPLE_FILTERS)
+        resample = str(self.config.get("image_display", {}).get("resample", "bilinear")).lower()
+        if resample not in _RESAMPLE_FILTERS:
+            print(f"Warning: Unknown image_display.resample '{resample}', using bilinear")
+            resample = "bilinear"
+        self.resample = _RESAMPLE_FILTERS[resample]
+        
+        # Optional gamma correction (image_display.gamma, 1.0 = off), applied once per
+        # loaded image through a 256-entry lookup table per channel
+        self.gamma_lut = _build_gamma_lut(self.config.get("image_display", {}).get("gamma", 1.0))
+        
+        # Reused for every frame (double buffering: SwapOnVSync hands back the other buffer)
+        self.canvas = self.matrix.CreateFrameCanvas()
     
     def load_and_resize_image(self, image_path: Path) -> Image.Image:
         """
@@ -57,10 +105,16 @@ class ImageDisplay:
         try:
             # Open and convert to RGB (handles RGBA, P, etc.)
             img = Image.open(image_path)
+            # JPEGs can be decoded at 1/2, 1/4 or 1/8 scale: don't decode more than
+            # twice the matrix size (headroom for the resize filter); no-op for other formats
+            img.draft("RGB", (self.width * 2, self.height * 2))
             img = img.convert("RGB")
             
-            # Resize to matrix dimensions, using LANCZOS for better quality
-            img = img.resize((self.width, self.height), Image.Resampling.LANCZOS)
+            # Resize to matrix dimensions with the configured filter
+            img = img.resize((self.width, self.height), self.resample)
+            
+            if self.gamma_lut is not None:
+                img = img.point(self.gamma_lut)
             
             return img
         except Exception as e:
@@ -73,19 +127,24 @@ class ImageDisplay:
         Args:
             image_path: Path to the image file.
         """
-        img = self.load_and_resize_image(image_path)
-        
-        # Get the canvas from the matrix
-        canvas = self.matrix.CreateFrameCanvas()
+        self.show_image(self.load_and_resize_image(image_path))
+    
+    def show_image(self, img: Image.Image):
+        """
+        Display an already loaded and resized image on the LED matrix.
         
-        # Draw each pixel
-        for y in range(self.height):
-            for x in range(self.width):
-                r, g, b = img.getpixel((x, y))
-                canvas.SetPixel(x, y, r, g, b)
+        Args:
+            img: Image with the matrix dimensions (see load_and_resize_image);
+                 converted to RGB if it isn't already.
+        """
+        # SetImage copies the whole image to the canvas in one C-level pass (reading
+        # Pillow's pixel buffer directly), but only accepts RGB images
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        self.canvas.SetImage(img, 0, 0)
         
         # Swap the canvas to display
-        canvas = self.matrix.SwapOnVSync(canvas)
+        self.canvas = self.matrix.SwapOnVSync(self.canvas)
     
     def display_image_continuous(self, image_path: Path, duration: float = None):
         """
@@ -96,28 +155,23 @@ class ImageDisplay:
             duration: How long to display the image in seconds. 
                      If None, displays until interrupted.
         """
+        # The image is static: paint it once, then just wait. The matrix keeps
+        # refreshing the displayed canvas on its own, so there's nothing to repaint.
+        self.display_image(image_path)
         try:
             if duration:
-                end_time = time.time() + duration
-                while time.time() < end_time:
-                    self.display_image(image_path)
-                    time.sleep(0.1)  # Small delay to prevent excessive CPU usage
+                time.sleep(duration)
             else:
                 # Display indefinitely
                 while True:
-                    self.display_image(image_path)
-                    time.sleep(0.1)
+                    time.sleep(3600)
         except KeyboardInterrupt:
             self.clear()
     
     def clear(self):
         """Clear the display."""
-        canvas = self.matrix.CreateFrameCanvas()
-        # Fill with black
-        for y in range(self.height):
-            for x in range(self.width):
-                canvas.SetPixel(x, y, 0, 0, 0)
-        self.matrix.SwapOnVSync(canvas)
+        self.canvas.Clear()
+        self.canvas = self.matrix.SwapOnVSync(self.canvas)
 
 
 def run():
@@ -3,6 +3,7 @@ Layout engine for LED matrix display.
 Provides CSS-like positioning with gravity and grid layouts.
 """
 
+import functools
 from dataclasses import dataclass
 from typing import Optional, List, Tuple, Dict, Any
 from enum import Enum
@@ -11,7 +12,7 @@ from rgbmatrix import RGBMatrix, graphics
 
 from style import Style, StyleManager
 from style_parser import create_style_manager
-from utils import get_text_width
+from utils import get_text_width, fill_rect
 
 
 class Gravity(Enum):
@@ -27,6 +28,16 @@ class Gravity(Enum):
     BOTTOM_RIGHT = "bottom-right"
 
 
+# Gravity lookup by CSS-like string, avoiding Enum construction per render
+_GRAVITY_BY_STR = {gravity.value: gravity for gravity in Gravity}
+
+
+@functools.lru_cache(maxsize=256)
+def _text_width(font: graphics.Font, text: str) -> int:
+    """Pixel width of text in font, measured once per distinct (font, text)."""
+    return get_text_width(font, text)
+
+
 @dataclass
 class Element:
     """Represents a positioned element on the canvas."""
@@ -61,6 +72,34 @@ class LayoutEngine:
         self.style_manager = style_manager or create_style_manager()
         self.width = matrix.width
         self.height = matrix.height
+        
+        # What was last drawn into each of the two swap buffers, for incremental
+        # rendering. None means unknown (buffer must be fully cleared).
+        self._buffer_contents: List[Optional[List[tuple]]] = [None, None]
+        self._buffer_index = 0
+        
+        # Resolved styles keyed by (classes, sorted overrides); the stylesheet is
+        # fixed for the lifetime of the engine so entries never go stale
+        self._style_cache: Dict[tuple, Style] = {}
+        
+        # Signature of the last render() and the back buffer it left behind, to skip
+        # redrawing (and swapping) identical frames
+        self._last_frame: Optional[Tuple[tuple, Any]] = None
+        
+        # Anchor (x, y) for each gravity as a function of (text_width, text_height, margin),
+        # built once since the canvas size never changes
+        width, height = self.width, self.height
+        self._gravity_table = {
+            Gravity.TOP_LEFT: lambda tw, th, m: (m, th + m),
+            Gravity.TOP_CENTER: lambda tw, th, m: ((width - tw) // 2, th + m),
+            Gravity.TOP_RIGHT: lambda tw, th, m: (width - tw - m, th + m),
+            Gravity.CENTER_LEFT: lambda tw, th, m: (m, (height + th) // 2),
+            Gravity.CENTER: lambda tw, th, m: ((width - tw) // 2, (height + th) // 2),
+            Gravity.CENTER_RIGHT: lambda tw, th, m: (width - tw - m, (height + th) // 2),
+            Gravity.BOTTOM_LEFT: lambda tw, th, m: (m, height - m),
+            Gravity.BOTTOM_CENTER: lambda tw, th, m: ((width - tw) // 2, height - m),
+            Gravity.BOTTOM_RIGHT: lambda tw, th, m: (width - tw - m, height - m),
+        }
     
     def calculate_position(
         self,
@@ -88,46 +127,25 @@ class LayoutEngine:
         # Use element gravity or style gravity
         gravity_str = element.gravity or style.gravity
         
-        try:
-            gravity = Gravity(gravity_str)
-        except ValueError:
-            # Invalid gravity, default to center
-            gravity = Gravity.CENTER
+        # Invalid gravity defaults to center
+        gravity = _GRAVITY_BY_STR.get(gravity_str, Gravity.CENTER)
         
         # Calculate position based on gravity
-        if gravity == Gravity.TOP_LEFT:
-            x = style.margin
-            y = text_height + style.margin
-        elif gravity == Gravity.TOP_CENTER:
-            x = (self.width - text_width) // 2
-            y = text_height + style.margin
-        elif gravity == Gravity.TOP_RIGHT:
-            x = self.width - text_width - style.margin
-            y = text_height + style.margin
-        elif gravity == Gravity.CENTER_LEFT:
-            x = style.margin
-            y = (self.height + text_height) // 2
-        elif gravity == Gravity.CENTER:
-            x = (self.width - text_width) // 2
-            y = (self.height + text_height) // 2
-        elif gravity == Gravity.CENTER_RIGHT:
-            x = self.width - text_width - style.margin
-            y = (self.height + text_height) // 2
-        elif gravity == Gravity.BOTTOM_LEFT:
-            x = style.margin
-            y = self.height - style.margin
-        elif gravity == Gravity.BOTTOM_CENTER:
-            x = (self.width - text_width) // 2
-            y = self.height - style.margin
-        elif gravity == Gravity.BOTTOM_RIGHT:
-            x = self.width - text_width - style.margin
-            y = self.height - style.margin
-        else:
-            # Fallback to center
-            x = (self.width - text_width) // 2
-            y = (self.height + text_height) // 2
-        
-        return (x, y)
+        return self._gravity_table[gravity](text_width, text_height, style.margin)
+    
+    def _resolve_style(self, element: Element) -> Style:
+        """Resolve an element's style, reusing the result for repeated classes/overrides."""
+        overrides = element.style_overrides
+        try:
+            key = (tuple(element.classes or ()), tuple(sorted(overrides.items())) if overrides else ())
+            style = self._style_cache.get(key)
+        except TypeError:
+            # Unhashable override values (e.g. an {"r", "g", "b"} color dict): resolve uncached
+            return self.style_manager.resolve_style(classes=element.classes, overrides=overrides)
+        if style is None:
+            style = self.style_manager.resolve_style(classes=element.classes, overrides=overrides)
+            self._style_cache[key] = style
+        return style
     
     def render_element(self, element: Element) -> None:
         """
@@ -137,24 +155,11 @@ class LayoutEngine:
             element: Element to render.
         """
         # Resolve style
-        style = self.style_manager.resolve_style(
-            classes=element.classes,
-            overrides=element.style_overrides
-        )
+        style = self._resolve_style(element)
         
         # Calculate text dimensions
-        text_width = get_text_width(style.font, element.text)
-        # Font height - estimate based on font size preset
-        # BDF fonts: xs (4x6) ≈ 6px, small (5x7) ≈ 7px, medium/large (7x13) ≈ 13px
-        font_size = style.font_size
-        if font_size == "xs":
-            text_height = 6
-        elif font_size == "small":
-            text_height = 7
-        elif font_size == "large":
-            text_height = 13
-        else:  # medium or default
-            text_height = 13
+        text_width = _text_width(style.font, element.text)
+        text_height = style.text_height
         
         # Calculate position
         x, y = self.calculate_position(element, style, text_width, text_height)
@@ -193,49 +198,49 @@ class LayoutEngine:
         cell_width = (self.width - total_gap_width) // columns
         cell_height = (self.height - total_gap_height) // rows
         
+        # Cell centers per column/row, computed once for the whole grid
+        pitch_x = cell_width + gap
+        pitch_y = cell_height + gap
+        half_cell_width = cell_width // 2
+        half_cell_height = cell_height // 2
+        auto_rows = max(rows, -(-len(elements) // columns))
+        center_x = [col * pitch_x + half_cell_width for col in range(columns)]
+        center_y = [row * pitch_y + half_cell_height for row in range(auto_rows)]
+        
         for i, element in enumerate(elements):
             # Determine grid position
             if element.grid_cell:
                 row, col = element.grid_cell
+                # Explicit cells may lie outside the configured grid
+                cell_center_x = center_x[col] if 0 <= col < columns else col * pitch_x + half_cell_width
+                cell_center_y = center_y[row] if 0 <= row < auto_rows else row * pitch_y + half_cell_height
             else:
                 # Auto-assign based on element index
-                row = i // columns
-                col = i % columns
-            
-            # Calculate cell bounds
-            cell_x = col * (cell_width + gap)
-            cell_y = row * (cell_height + gap)
+                row, col = divmod(i, columns)
+                cell_center_x = center_x[col]
+                cell_center_y = center_y[row]
             
             # Resolve style
-            style = self.style_manager.resolve_style(
-                classes=element.classes,
-                overrides=element.style_overrides
-            )
+            style = self._resolve_style(element)
             
             # Calculate text dimensions
-            text_width = get_text_width(style.font, element.text)
-            # Font height - estimate based on font size preset
-            font_size = style.font_size
-            if font_size == "xs":
-                text_height = 6
-            elif font_size == "small":
-                text_height = 7
-            elif font_size == "large":
-                text_height = 13
-            else:  # medium or default
-                text_height = 13
-            
-            # Calculate position within cell (center by default)
-            cell_center_x = cell_x + cell_width // 2
-            cell_center_y = cell_y + cell_height // 2
+            text_width = _text_width(style.font, element.text)
+            text_height = style.text_height
             
+            # Position within cell (center by default)
             x = cell_center_x - text_width // 2
             y = cell_center_y + text_height // 2
             
             # Draw text
             graphics.DrawText(self.canvas, style.font, x, y, style.color, element.text)
     
-    def render(self, elements: List[Element], use_grid: bool = False, grid_config: Optional[Dict[str, Any]] = None) -> None:
+    def render(
+        self,
+        elements: List[Element],
+        use_grid: bool = False,
+        grid_config: Optional[Dict[str, Any]] = None,
+        incremental: bool = False
+    ) -> None:
         """
         Render a list of elements on the canvas.
         
@@ -243,7 +248,52 @@ class LayoutEngine:
             elements: List of elements to render.
             use_grid: Whether to use grid layout.
             grid_config: Optional grid configuration (columns, rows, gap).
+            incremental: Only redraw glyphs that differ from what the back buffer
+                already shows, instead of clearing it (gravity layout only).
         """
+        # Same elements as the frame on screen: nothing to draw. The back buffer check
+        # catches callers that swapped self.canvas themselves since.
+        signature = self._frame_signature(elements, use_grid, grid_config)
+        if signature is not None and self._last_frame == (signature, self.canvas):
+            return
+        
+        self._render_frame(elements, use_grid, grid_config, incremental)
+        self._last_frame = (signature, self.canvas)
+    
+    def _frame_signature(
+        self,
+        elements: List[Element],
+        use_grid: bool,
+        grid_config: Optional[Dict[str, Any]]
+    ) -> Optional[tuple]:
+        """Hashable description of a render() call, or None if it can't be built."""
+        try:
+            return (
+                use_grid,
+                tuple(sorted(grid_config.items())) if grid_config else (),
+                tuple(
+                    (element.text, tuple(element.classes or ()),
+                     tuple(sorted(element.style_overrides.items())) if element.style_overrides else (),
+                     element.gravity, element.x, element.y, element.grid_cell)
+                    for element in elements
+                ),
+            )
+        except TypeError:
+            # Override or grid keys that can't be sorted: always render
+            return None
+    
+    def _render_frame(
+        self,
+        elements: List[Element],
+        use_grid: bool,
+        grid_config: Optional[Dict[str, Any]],
+        incremental: bool
+    ) -> None:
+        """Draw elements into the back buffer and swap it on screen (see render)."""
+        if incremental and not use_grid:
+            self._render_incremental(elements)
+            return
+        
         self.canvas.Clear()
         
         if use_grid:
@@ -261,10 +311,76 @@ class LayoutEngine:
             for element in elements:
                 self.render_element(element)
         
+        self._swap(None)
+    
+    def _place_element(self, element: Element) -> tuple:
+        """Resolve style and position for an element as a comparable draw record."""
+        style = self._resolve_style(element)
+        text_width = _text_width(style.font, element.text)
+        text_height = style.text_height
+        x, y = self.calculate_position(element, style, text_width, text_height)
+        color = style.color
+        return (element.text, x, y, style.font, (color.red, color.green, color.blue))
+    
+    def position_for(self, element: Element) -> Tuple[int, int]:
+        """
+        Get the (x, y) position an element would be drawn at.
+        Useful for callers that pin positions up front via Element.x/y.
+        """
+        _, x, y, _, _ = self._place_element(element)
+        return (x, y)
+    
+    def _glyph_box(self, font: graphics.Font, x: int, y: int, text: str) -> Tuple[int, int, int, int]:
+        """Inclusive pixel box covered by text drawn with its baseline at y."""
+        top = y - font.baseline
+        return (x, top, x + _text_width(font, text) - 1, top + font.height - 1)
+    
+    def _render_incremental(self, elements: List[Element]) -> None:
+        """Draw elements into the back buffer, touching only changed glyphs."""
+        records = [self._place_element(element) for element in elements]
+        previous = self._buffer_contents[self._buffer_index]
+        black = graphics.Color(0, 0, 0)
+        
+        if previous is None or len(previous) != len(records):
+            self.canvas.Clear()
+            for text, x, y, font, rgb in records:
+                graphics.DrawText(self.canvas, font, x, y, graphics.Color(*rgb), text)
+            self._swap(records)
+            return
+        
+        redraw = []
+        for old, new in zip(previous, records):
+            if old == new:
+                continue
+            old_text, old_x, old_y, old_font, old_rgb = old
+            text, x, y, font, rgb = new
+            if (old_x, old_y, old_font, old_rgb) == (x, y, font, rgb) and len(old_text) == len(text):
+                # Same slot, same length: repaint only the characters that changed
+                char_x = x
+                for old_char, char in zip(old_text, text):
+                    width = font.CharacterWidth(ord(char))
+                    if old_char != char:
+                        fill_rect(self.canvas, *self._glyph_box(font, char_x, y, old_char), black)
+                        redraw.append((char, char_x, y, font, rgb))
+                    char_x += width
+            else:
+                fill_rect(self.canvas, *self._glyph_box(old_font, old_x, old_y, old_text), black)
+                redraw.append(new)
+        
+        for text, x, y, font, rgb in redraw:
+            graphics.DrawText(self.canvas, font, x, y, graphics.Color(*rgb), text)
+        self._swap(records)
+    
+    def _swap(self, drawn: Optional[List[tuple]]) -> None:
+        """Swap buffers, remembering what was drawn into the buffer going on screen."""
+        self._buffer_contents[self._buffer_index] = drawn
+        self._buffer_index ^= 1
         self.canvas = self.matrix.SwapOnVSync(self.canvas)
     
     def clear(self) -> None:
         """Clear the canvas."""
         self.canvas.Clear()
-        self.canvas = self.matrix.SwapOnVSync(self.canvas)
+        self._swap(None)
+        self._buffer_contents = [None, None]
+        self._last_frame = None
 
@@ -14,11 +14,6 @@ import argparse
 import sys
 
 from utils import load_config, create_matrix
-from text_scroller import TextScroller
-from clock import Clock
-from weather import Weather
-from time_weather_calendar import TimeWeatherCalendar
-from flight_tracker import FlightTracker
 
 
 def parse_args():
@@ -38,7 +33,7 @@ Examples:
     
     parser.add_argument(
         "--mode", "-m",
-        choices=["text", "clock", "weather", "time_weather_calendar", "flight_tracker"],
+        choices=list(MODES),
         default="text",
         help="Display mode (default: text)"
     )
@@ -82,6 +77,8 @@ Examples:
 
 def run_text_mode(args, config, matrix, style_manager=None):
     """Run text display mode."""
+    from text_scroller import TextScroller
+    
     scroller = TextScroller(matrix=matrix, config=config, style_manager=style_manager)
     
     # Get message from args or config
@@ -113,6 +110,8 @@ def run_text_mode(args, config, matrix, style_manager=None):
 
 def run_clock_mode(args, config, matrix, style_manager=None):
     """Run clock display mode."""
+    from clock import Clock
+    
     clock = Clock(matrix=matrix, config=config, style_manager=style_manager)
     
     print("Displaying clock")
@@ -128,6 +127,8 @@ def run_clock_mode(args, config, matrix, style_manager=None):
 
 def run_weather_mode(args, config, matrix, style_manager=None):
     """Run weather display mode."""
+    from weather import Weather
+    
     weather_config = config.get("weather", {})
     api_key = weather_config.get("api_key", "")
     
@@ -152,6 +153,8 @@ def run_weather_mode(args, config, matrix, style_manager=None):
 
 def run_time_weather_calendar_mode(args, config, matrix, style_manager=None):
     """Run time_weather_calendar composite display mode."""
+    from time_weather_calendar import TimeWeatherCalendar
+    
     # Check for API key in time_weather_calendar config or fallback to weather config
     twc_config = config.get("time_weather_calendar", {})
     weather_config = twc_config.get("weather", {}) if twc_config else {}
@@ -181,6 +184,8 @@ def run_time_weather_calendar_mode(args, config, matrix, style_manager=None):
 
 def run_flight_tracker_mode(args, config, matrix, style_manager=None):
     """Run flight tracker display mode."""
+    from flight_tracker import FlightTracker
+    
     flight_config = config.get("flight_tracker", {})
     latitude = flight_config.get("latitude", 0.0)
     longitude = flight_config.get("longitude", 0.0)
@@ -204,6 +209,17 @@ def run_flight_tracker_mode(args, config, matrix, style_manager=None):
         tracker.clear()
 
 
+# Mode name -> runner. Each runner imports its display class itself, so only the
+# selected mode's dependencies are loaded at startup
+MODES = {
+    "text": run_text_mode,
+    "clock": run_clock_mode,
+    "weather": run_weather_mode,
+    "time_weather_calendar": run_time_weather_calendar_mode,
+    "flight_tracker": run_flight_tracker_mode,
+}
+
+
 def main():
     """Main entry point."""
     args = parse_args()
@@ -240,16 +256,7 @@ def main():
     
     # Run the appropriate mode
     try:
-        if args.mode == "text":
-            run_text_mode(args, config, None, style_manager)
-        elif args.mode == "clock":
-            run_clock_mode(args, config, None, style_manager)
-        elif args.mode == "weather":
-            run_weather_mode(args, config, None, style_manager)
-        elif args.mode == "time_weather_calendar":
-            run_time_weather_calendar_mode(args, config, None, style_manager)
-        elif args.mode == "flight_tracker":
-            run_flight_tracker_mode(args, config, None, style_manager)
+        MODES[args.mode](args, config, None, style_manager)
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
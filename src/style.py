@@ -16,6 +16,9 @@ from utils import (
     get_project_root,
 )
 
+# Text height in pixels per font size preset; anything else (e.g. a font filename) is 13
+FONT_HEIGHTS = {"xs": 6, "small": 7, "medium": 13, "large": 13}
+
 
 @dataclass
 class Style:
@@ -29,11 +32,14 @@ class Style:
     gravity: str = "center"
     padding: int = 0
     margin: int = 0
+    text_height: Optional[int] = None
     
     def __post_init__(self):
-        """Initialize font after object creation."""
+        """Initialize font and text height after object creation."""
         if self.font is None:
             self.font = load_font("7x13.bdf")
+        if self.text_height is None:
+            self.text_height = FONT_HEIGHTS.get(self.font_size, 13)
 
 
 class StyleManager:
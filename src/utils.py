@@ -195,6 +195,20 @@ def fill_canvas_background(canvas, color: graphics.Color):
         graphics.DrawLine(canvas, 0, y, canvas.width - 1, y, color)
 
 
+def fill_rect(canvas, x0: int, y0: int, x1: int, y1: int, color: graphics.Color):
+    """
+    Fill an inclusive rectangle on the canvas, clipped to the canvas bounds.
+    """
+    x0 = max(0, x0)
+    y0 = max(0, y0)
+    x1 = min(canvas.width - 1, x1)
+    y1 = min(canvas.height - 1, y1)
+    if x0 > x1:
+        return
+    for y in range(y0, y1 + 1):
+        graphics.DrawLine(canvas, x0, y, x1, y, color)
+
+
 def get_default_stylesheet() -> dict:
     """Return default stylesheet when file cannot be loaded."""
     return {